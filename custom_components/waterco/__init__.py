@@ -6,20 +6,37 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.const import Platform
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN, PLATFORMS
-from .coordinator import ElectrochlorDataUpdateCoordinator
+from .const import CONF_RECORD_TRAFFIC, DATA_SCHEDULER, DOMAIN, PLATFORMS
+from .coordinator import ElectrochlorDataUpdateCoordinator, async_remove_stored_snapshot
+from .runtime import async_remove_stored_runtime
+from .scheduler import async_get_scheduler
+from .services import async_setup_services
+from .stats import async_remove_stored_statistics, statistics_windows
 
 _LOGGER = logging.getLogger(__name__)
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Waterco Electrochlor services."""
+    async_setup_services(hass)
+    return True
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Waterco Electrochlor from a config entry."""
     hass.data.setdefault(DOMAIN, {})
 
-    coordinator = ElectrochlorDataUpdateCoordinator(hass, entry)
+    scheduler = async_get_scheduler(hass)
+    scheduler.register(entry.entry_id)
+    coordinator = ElectrochlorDataUpdateCoordinator(hass, entry, scheduler)
     try:
         await coordinator.async_setup()
     except Exception as err:
+        await coordinator.async_shutdown()
+        _async_release_scheduler(hass, entry)
         raise ConfigEntryNotReady from err
 
     hass.data[DOMAIN][entry.entry_id] = coordinator
@@ -34,15 +51,39 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id, None)
+        coordinator: ElectrochlorDataUpdateCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.async_shutdown()
+        _async_release_scheduler(hass, entry)
         if not hass.data[DOMAIN]:
             hass.data.pop(DOMAIN)
     return unload_ok
 
+def _async_release_scheduler(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Drop an entry from the shared scheduler, removing it when unused."""
+    scheduler = async_get_scheduler(hass)
+    scheduler.unregister(entry.entry_id)
+    if scheduler.empty:
+        hass.data.pop(DATA_SCHEDULER)
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove persisted data for a deleted config entry."""
+    await async_remove_stored_snapshot(hass, entry)
+    await async_remove_stored_statistics(hass, entry)
+    await async_remove_stored_runtime(hass, entry)
+
 async def _async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Update options."""
     coordinator: ElectrochlorDataUpdateCoordinator | None = hass.data.get(DOMAIN, {}).get(entry.entry_id)
     if coordinator is None:
         return
+    recording = bool(entry.options.get(CONF_RECORD_TRAFFIC))
+    if (
+        statistics_windows(entry) != coordinator.statistics.hours
+        or recording != (coordinator.recorder is not None)
+    ):
+        # Statistics sensors are created per window and the recorder is
+        # wired into the transport at setup, so rebuild the entry.
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
     coordinator.update_from_entry(entry)
     await coordinator.async_request_refresh()
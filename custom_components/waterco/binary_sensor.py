@@ -2,101 +2,119 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
+from dataclasses import dataclass
 from typing import Any
 
-from homeassistant.components.binary_sensor import BinarySensorEntity
+from homeassistant.components.binary_sensor import (
+    BinarySensorDeviceClass,
+    BinarySensorEntity,
+    BinarySensorEntityDescription,
+)
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import ElectrochlorDataUpdateCoordinator
-from .device_info import make_device_info
-from .device_icons import ICONS
+from .entity import ElectrochlorEntity, async_add_supported_entities
+from .device_icons import icon_table
+from .snapshot import ElectrochlorSnapshot
 
 _LOGGER = logging.getLogger(__name__)
 
-BINARY_SENSOR_CONFIG: list[dict[str, Any]] = [
-    {"key": "pump", "name": "Pool Pump", "device_class": "running"},
-    {"key": "light", "name": "Pool Light"},
-    {"key": "phPump", "name": "Pool pH Pump", "device_class": "running"},
-    {"key": "valve", "name": "Pool Valve"},
-    {"key": "aux2", "name": "Pool Aux2"},
-    {"key": "cellDirectionA", "name": "Pool Chlorinator Cell Direction A"},
-    {"key": "cellDirectionB", "name": "Pool Chlorinator Cell Direction B"},
-    {"key": "error", "name": "Pool Chlorinator Error", "device_class": "problem", "special": "error"},
-    {"key": "saltStatus", "name": "Pool Salt Fault", "device_class": "problem", "special": "salt_fault"},
-]
+@dataclass(frozen=True, kw_only=True)
+class ElectrochlorBinarySensorEntityDescription(BinarySensorEntityDescription):
+    """Describes an Electrochlor on/off reading."""
+
+    # Special extractor replacing the status flag lookup.
+    is_on_fn: Callable[[ElectrochlorSnapshot], bool] | None = None
+
+
+def _salt_fault(snapshot: ElectrochlorSnapshot) -> bool:
+    return snapshot.get("saltStatus") in ("FAULT", "fault")
+
+
+def _error(snapshot: ElectrochlorSnapshot) -> bool:
+    return bool(snapshot.get("error", False))
+
+
+BINARY_SENSOR_DESCRIPTIONS: tuple[ElectrochlorBinarySensorEntityDescription, ...] = (
+    ElectrochlorBinarySensorEntityDescription(
+        key="pump", name="Pool Pump", device_class=BinarySensorDeviceClass.RUNNING
+    ),
+    ElectrochlorBinarySensorEntityDescription(key="light", name="Pool Light"),
+    ElectrochlorBinarySensorEntityDescription(
+        key="phPump", name="Pool pH Pump", device_class=BinarySensorDeviceClass.RUNNING
+    ),
+    ElectrochlorBinarySensorEntityDescription(key="valve", name="Pool Valve"),
+    ElectrochlorBinarySensorEntityDescription(key="aux2", name="Pool Aux2"),
+    ElectrochlorBinarySensorEntityDescription(
+        key="cellDirectionA", name="Pool Chlorinator Cell Direction A"
+    ),
+    ElectrochlorBinarySensorEntityDescription(
+        key="cellDirectionB", name="Pool Chlorinator Cell Direction B"
+    ),
+    ElectrochlorBinarySensorEntityDescription(
+        key="error",
+        name="Pool Chlorinator Error",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        is_on_fn=_error,
+    ),
+    ElectrochlorBinarySensorEntityDescription(
+        key="saltStatus",
+        name="Pool Salt Fault",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        is_on_fn=_salt_fault,
+    ),
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up Electrochlor binary sensors."""
     coordinator: ElectrochlorDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
-    sensors = [GenericPoolBinarySensor(coordinator, entry, cfg) for cfg in BINARY_SENSOR_CONFIG]
-    async_add_entities(sensors)
+    async_add_supported_entities(
+        coordinator,
+        entry,
+        async_add_entities,
+        BINARY_SENSOR_DESCRIPTIONS,
+        lambda description: GenericPoolBinarySensor(coordinator, entry, description),
+    )
 
 
-class GenericPoolBinarySensor(CoordinatorEntity[ElectrochlorDataUpdateCoordinator], BinarySensorEntity):
+class GenericPoolBinarySensor(ElectrochlorEntity, BinarySensorEntity):
     """Binary sensor entity with dynamic icons."""
 
+    entity_description: ElectrochlorBinarySensorEntityDescription
+
     def __init__(
         self,
         coordinator: ElectrochlorDataUpdateCoordinator,
         entry: ConfigEntry,
-        config: dict[str, Any],
+        description: ElectrochlorBinarySensorEntityDescription,
     ) -> None:
-        super().__init__(coordinator)
-        self._entry = entry
-        self.config = config
-        self._attr_name = config["name"]
-        self._attr_unique_id = f"{entry.entry_id}_{config['key']}"
-        self._attr_device_class = config.get("device_class")
-        self._optimistic_state: bool | None = None
-
-    @property
-    def is_on(self) -> bool:
-        """Return True if the binary sensor is on."""
-        if self._optimistic_state is not None:
-            return self._optimistic_state
-
-        data = self.coordinator.data or {}
-        result = data.get("result", {})
-        status = result.get("status", {})
-        key = self.config["key"]
-        special = self.config.get("special")
-
-        if special == "salt_fault":
-            return result.get("saltStatus") == "FAULT" or result.get("saltStatus") == "fault"
-
-        if special == "error":
-            return bool(data.get("error", False))
-
-        if key in ["cellDirectionA", "cellDirectionB"]:
-            return bool(status.get(key, False))
-
-        return bool(status.get(key, False))
-
-    @property
-    def icon(self) -> str:
-        key = self.config["key"]
-        state = self.is_on
-        icons_for_key = ICONS.get(key, {})
-        if state and "on" in icons_for_key:
-            return icons_for_key["on"]
-        if not state and "off" in icons_for_key:
-            return icons_for_key["off"]
-        return icons_for_key.get("default", "mdi:help-circle")
-
-    @property
-    def available(self) -> bool:
-        return self.coordinator.last_update_success
-
-    @property
-    def device_info(self):
-        api_data = self.coordinator.data.get("result") if isinstance(self.coordinator.data, dict) else None
-        return make_device_info(self._entry, api_data)
+        super().__init__(coordinator, entry)
+        self.entity_description = description
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+        self._icons = icon_table(description.key)
+
+    def _update_from_snapshot(self) -> None:
+        """Resolve the on/off state and its icon from the current snapshot."""
+        snapshot = self.coordinator.data
+        description = self.entity_description
+        if snapshot is None:
+            is_on = False
+        elif description.is_on_fn is not None:
+            is_on = description.is_on_fn(snapshot)
+        else:
+            is_on = bool(snapshot.status.get(description.key, False))
+        self._attr_is_on = is_on
+        self._attr_icon = self._icons.for_state(is_on)
+
+    def _state_signature(self) -> tuple[Any, ...]:
+        return (self._attr_is_on, self._attr_icon)
 
     async def async_update(self) -> None:
         await self.coordinator.async_request_refresh()
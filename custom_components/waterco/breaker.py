@@ -0,0 +1,85 @@
+"""Circuit breaker guarding device I/O for Waterco Electrochlor integration."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from enum import StrEnum
+from time import monotonic
+
+FAILURE_THRESHOLD = 3
+RESET_TIMEOUT = 30  # seconds
+
+
+class BreakerState(StrEnum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of contacting a device that is known to be down."""
+
+
+class CircuitBreaker:
+    """Fail fast after repeated device errors, probing once per reset timeout.
+
+    Closed lets every request through. After FAILURE_THRESHOLD consecutive
+    failures the breaker opens and rejects requests without touching the
+    network. Once RESET_TIMEOUT has passed, the next request is let through
+    as a single half-open probe: success closes the breaker, failure opens
+    it again.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = FAILURE_THRESHOLD,
+        reset_timeout: float = RESET_TIMEOUT,
+        on_change: Callable[[], None] | None = None,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.on_change = on_change
+        self.state = BreakerState.CLOSED
+        self.failures = 0
+        self.trips = 0
+        self._opened_at = 0.0
+        self._probing = False
+
+    def _set_state(self, state: BreakerState) -> None:
+        if state is not self.state:
+            self.state = state
+            if self.on_change is not None:
+                self.on_change()
+
+    def check(self) -> None:
+        """Raise CircuitOpenError unless a request may go out now."""
+        if self.state is BreakerState.CLOSED:
+            return
+        if self.state is BreakerState.OPEN:
+            if monotonic() - self._opened_at < self.reset_timeout:
+                raise CircuitOpenError("Device circuit is open")
+            self._set_state(BreakerState.HALF_OPEN)
+        if self._probing:
+            raise CircuitOpenError("Device circuit is half-open; probe in flight")
+        self._probing = True
+
+    def release(self) -> None:
+        """Forget an abandoned request without judging the device."""
+        self._probing = False
+
+    def record_success(self) -> None:
+        """Close the breaker after the device answered."""
+        self._probing = False
+        self.failures = 0
+        self._set_state(BreakerState.CLOSED)
+
+    def record_failure(self) -> None:
+        """Count a failed request, opening the breaker when needed."""
+        self._probing = False
+        self.failures += 1
+        if self.state is BreakerState.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state is not BreakerState.OPEN:
+                self.trips += 1
+            self._opened_at = monotonic()
+            self._set_state(BreakerState.OPEN)
@@ -0,0 +1,68 @@
+"""Payload keys reported per controller model for Waterco Electrochlor integration."""
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DATA_CAPABILITIES, DOMAIN
+from .snapshot import ElectrochlorSnapshot
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 10  # seconds
+# Bucket for payloads that do not name their model.
+UNKNOWN_MODEL = ""
+
+
+def reported_keys(snapshot: ElectrochlorSnapshot) -> set[str]:
+    """Return the keys a snapshot carries a value for, at any depth."""
+    return {key for key, value in snapshot.values.items() if value is not None}
+
+
+class CapabilityMap:
+    """Keys each controller model has reported, shared by all entries.
+
+    Keys are only ever added, so a key a model reported once keeps its
+    entities even if a later payload leaves it out.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._store: Store[dict[str, list[str]]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.capabilities"
+        )
+        self._models: dict[str, set[str]] = {}
+        self._loaded = False
+        self._lock = asyncio.Lock()
+
+    async def async_load(self) -> None:
+        async with self._lock:
+            if self._loaded:
+                return
+            stored = await self._store.async_load() or {}
+            self._models = {model: set(keys) for model, keys in stored.items()}
+            self._loaded = True
+
+    def keys(self, model: str | None) -> frozenset[str]:
+        return frozenset(self._models.get(model or UNKNOWN_MODEL, ()))
+
+    @callback
+    def add(self, model: str | None, keys: set[str]) -> None:
+        known = self._models.setdefault(model or UNKNOWN_MODEL, set())
+        if not keys <= known:
+            known |= keys
+            self._store.async_delay_save(self._data_to_store, SAVE_DELAY)
+
+    @callback
+    def _data_to_store(self) -> dict[str, Any]:
+        return {model: sorted(keys) for model, keys in self._models.items()}
+
+
+async def async_get_capability_map(hass: HomeAssistant) -> CapabilityMap:
+    """Return the integration's loaded capability map, creating it if needed."""
+    capabilities: CapabilityMap | None = hass.data.get(DATA_CAPABILITIES)
+    if capabilities is None:
+        capabilities = hass.data[DATA_CAPABILITIES] = CapabilityMap(hass)
+    await capabilities.async_load()
+    return capabilities
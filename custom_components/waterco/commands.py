@@ -0,0 +1,149 @@
+"""Serialized, coalescing command queue for Waterco Electrochlor integration."""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+from .transport import ElectrochlorTransport
+
+_LOGGER = logging.getLogger(__name__)
+
+# Minimum gap between two POSTs so the controller firmware keeps up.
+COMMAND_SPACING = 0.5  # seconds
+
+
+@dataclass(slots=True)
+class CommandStats:
+    """Queue depth and latency counters for device commands."""
+
+    sent: int = 0
+    failed: int = 0
+    coalesced: int = 0
+    max_depth: int = 0
+    last_latency: float | None = None
+    total_latency: float = 0.0
+
+    @property
+    def average_latency(self) -> float | None:
+        """Mean time from enqueue to device acknowledgement, in seconds."""
+        done = self.sent + self.failed
+        return self.total_latency / done if done else None
+
+
+@dataclass(slots=True)
+class _PendingCommand:
+    value: Any
+    queued_at: float
+    futures: list[asyncio.Future[bool]] = field(default_factory=list)
+
+
+class CommandQueue:
+    """Send commands to one controller one at a time, keeping only the latest value per path."""
+
+    def __init__(
+        self, hass: HomeAssistant, entry: ConfigEntry, transport: ElectrochlorTransport
+    ) -> None:
+        self.hass = hass
+        self.entry = entry
+        self.transport = transport
+        self.stats = CommandStats()
+        self._pending: dict[str, _PendingCommand] = {}
+        self._task: asyncio.Task[None] | None = None
+        self._last_sent = 0.0
+
+    @property
+    def depth(self) -> int:
+        """Number of distinct commands waiting to be sent."""
+        return len(self._pending)
+
+    def is_pending(self, path: str) -> bool:
+        """Return True if a command for path is waiting to be sent."""
+        return path in self._pending
+
+    async def async_send(self, path: str, value: Any) -> bool:
+        """Queue a command and wait until it has been sent.
+
+        A newer command for the same path replaces an unsent older one in
+        place. The superseded caller gets False back, as its value never
+        reached the device; otherwise the result says whether the POST
+        succeeded.
+        """
+        future: asyncio.Future[bool] = self.hass.loop.create_future()
+        pending = self._pending.get(path)
+        if pending is None:
+            self._pending[path] = _PendingCommand(value, monotonic(), [future])
+        else:
+            for superseded in pending.futures:
+                if not superseded.done():
+                    superseded.set_result(False)
+            self.stats.coalesced += len(pending.futures)
+            pending.value = value
+            pending.futures = [future]
+        self.stats.max_depth = max(self.stats.max_depth, len(self._pending))
+
+        if self._task is None or self._task.done():
+            self._task = self.entry.async_create_background_task(
+                self.hass, self._async_worker(), f"{self.transport.host} command queue"
+            )
+        return await future
+
+    async def _async_worker(self) -> None:
+        sending: _PendingCommand | None = None
+        try:
+            while self._pending:
+                wait = self._last_sent + COMMAND_SPACING - monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                path = next(iter(self._pending))
+                sending = self._pending.pop(path)
+
+                ok = await self.transport.async_send_command(path, sending.value)
+                self._last_sent = monotonic()
+                latency = self._last_sent - sending.queued_at
+                self.stats.last_latency = latency
+                self.stats.total_latency += latency
+                if ok:
+                    self.stats.sent += 1
+                else:
+                    self.stats.failed += 1
+                _LOGGER.debug(
+                    "Sent %s=%s in %.3fs (%s queued)", path, sending.value, latency, len(self._pending)
+                )
+                for future in sending.futures:
+                    if not future.done():
+                        future.set_result(ok)
+                sending = None
+        except asyncio.CancelledError:
+            if sending is not None:
+                self._fail(sending)
+            self._fail_all()
+            raise
+
+    async def async_shutdown(self) -> None:
+        """Stop the worker and fail every command that was not sent."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+        self._task = None
+        # A worker cancelled before its first step never saw the queue.
+        self._fail_all()
+
+    def _fail_all(self) -> None:
+        while self._pending:
+            self._fail(self._pending.pop(next(iter(self._pending))))
+
+    def _fail(self, pending: _PendingCommand) -> None:
+        for future in pending.futures:
+            if not future.done():
+                future.set_exception(
+                    HomeAssistantError(f"Command queue for {self.transport.host} was stopped")
+                )
@@ -1,18 +1,58 @@
 """Config flow for Waterco Electrochlor integration."""
 from __future__ import annotations
+import asyncio
 import logging
 from typing import Any
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.const import CONF_PORT
+from homeassistant.const import CONF_HOST, CONF_PORT
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.core import callback
-
-from .const import DOMAIN, CONF_IP_ADDRESS, DEFAULT_PORT, DEFAULT_SCAN_INTERVAL, CONF_SCAN_INTERVAL
+import homeassistant.helpers.config_validation as cv
+
+from .const import (
+    DOMAIN,
+    CONF_IP_ADDRESS,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_SCAN_MODE,
+    CONF_STATISTICS_WINDOWS,
+    CONF_CHLORINE_DEADBAND,
+    CONF_GRACE_FAILURES,
+    CONF_GRACE_PERIOD,
+    CONF_HEARTBEAT_INTERVAL,
+    CONF_MAX_REQUEST_RATE,
+    CONF_MIN_PUBLISH_INTERVAL,
+    CONF_PH_DEADBAND,
+    CONF_RECORD_TRAFFIC,
+    CONF_TEMP_DEADBAND,
+    DEFAULT_CHLORINE_DEADBAND,
+    DEFAULT_GRACE_FAILURES,
+    DEFAULT_GRACE_PERIOD,
+    DEFAULT_HEARTBEAT_INTERVAL,
+    DEFAULT_MAX_REQUEST_RATE,
+    DEFAULT_MIN_PUBLISH_INTERVAL,
+    DEFAULT_PH_DEADBAND,
+    DEFAULT_RECORD_TRAFFIC,
+    DEFAULT_TEMP_DEADBAND,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_PORT,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_STATISTICS_WINDOWS,
+    CONF_SCAN_INTERVAL,
+    SCAN_MODE_FIXED,
+    SCAN_MODES,
+    STATISTICS_WINDOW_OPTIONS,
+)
+from .discovery import VALIDATE_TIMEOUT, DiscoveredController, async_discover, async_probe
 
 _LOGGER = logging.getLogger(__name__)
 
+# Choice in the discovered controller list that switches to manual entry.
+MANUAL_ENTRY = "manual"
+
 
 class ElectrochlorConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Waterco Electrochlor."""
@@ -20,16 +60,66 @@ class ElectrochlorConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 1
     CONNECTION_CLASS = config_entries.CONN_CLASS_LOCAL_POLL  # Fixed from CONN_CLASS_LOCAL_POLLING
 
+    def __init__(self) -> None:
+        self._discovered: dict[str, DiscoveredController] = {}
+        self._scan_task: asyncio.Task[dict[str, DiscoveredController]] | None = None
+
     async def async_step_user(self, user_input: dict[str, Any] | None = None) -> FlowResult:
-        """Handle the initial step."""
+        """Scan the local network in the background while showing progress."""
+        if self._scan_task is None:
+            self._scan_task = self.hass.async_create_task(self._async_scan())
+        if not self._scan_task.done():
+            return self.async_show_progress(
+                step_id="user", progress_action="scan", progress_task=self._scan_task
+            )
+        self._discovered = self._scan_task.result()
+        return self.async_show_progress_done(
+            next_step_id="pick" if self._discovered else "manual"
+        )
+
+    async def _async_scan(self) -> dict[str, DiscoveredController]:
+        configured = {entry.data.get(CONF_IP_ADDRESS) for entry in self._async_current_entries()}
+        return {
+            controller.host: controller
+            for controller in await async_discover(self.hass)
+            if controller.host not in configured
+        }
+
+    async def async_step_pick(self, user_input: dict[str, Any] | None = None) -> FlowResult:
+        """Offer the controllers found by the scan."""
+        if user_input is not None:
+            host = user_input[CONF_HOST]
+            if host == MANUAL_ENTRY:
+                return await self.async_step_manual()
+            controller = self._discovered[host]
+            return await self._async_create_controller_entry(
+                host, controller.port, user_input[CONF_SCAN_INTERVAL]
+            )
+
+        choices = {
+            host: f"{controller.model or 'Electrochlor'} ({host})"
+            for host, controller in self._discovered.items()
+        }
+        choices[MANUAL_ENTRY] = "Enter address manually"
+        data_schema = vol.Schema({
+            vol.Required(CONF_HOST): vol.In(choices),
+            vol.Optional(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): int,
+        })
+        return self.async_show_form(step_id="pick", data_schema=data_schema)
+
+    async def async_step_manual(self, user_input: dict[str, Any] | None = None) -> FlowResult:
+        """Handle a manually entered address, checking that a controller answers."""
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            await self.async_set_unique_id(user_input[CONF_IP_ADDRESS])
-            self._abort_if_unique_id_configured(updates=user_input)
-            return self.async_create_entry(
-                title=f"Electrochlor {user_input[CONF_IP_ADDRESS]}", data=user_input
-            )
+            ip_address = user_input[CONF_IP_ADDRESS]
+            port = user_input[CONF_PORT]
+            if await async_probe(self.hass, ip_address, port, VALIDATE_TIMEOUT) is None:
+                errors["base"] = "cannot_connect"
+            else:
+                return await self._async_create_controller_entry(
+                    ip_address, port, user_input[CONF_SCAN_INTERVAL]
+                )
 
         data_schema = vol.Schema({
             vol.Required(CONF_IP_ADDRESS): str,
@@ -37,7 +127,19 @@ class ElectrochlorConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             vol.Optional(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): int,
         })
 
-        return self.async_show_form(step_id="user", data_schema=data_schema, errors=errors)
+        return self.async_show_form(step_id="manual", data_schema=data_schema, errors=errors)
+
+    async def _async_create_controller_entry(
+        self, ip_address: str, port: int, scan_interval: int
+    ) -> FlowResult:
+        data = {
+            CONF_IP_ADDRESS: ip_address,
+            CONF_PORT: port,
+            CONF_SCAN_INTERVAL: scan_interval,
+        }
+        await self.async_set_unique_id(ip_address)
+        self._abort_if_unique_id_configured(updates=data)
+        return self.async_create_entry(title=f"Electrochlor {ip_address}", data=data)
 
     @staticmethod
     @callback
@@ -57,11 +159,64 @@ class ElectrochlorOptionsFlowHandler(config_entries.OptionsFlow):
         if user_input is not None:
             return self.async_create_entry(title="", data=user_input)
 
+        options = self.config_entry.options
         data_schema = vol.Schema({
             vol.Optional(
                 CONF_SCAN_INTERVAL,
-                default=self.config_entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+                default=options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
             ): int,
+            vol.Optional(
+                CONF_SCAN_MODE,
+                default=options.get(CONF_SCAN_MODE, SCAN_MODE_FIXED)
+            ): vol.In(SCAN_MODES),
+            vol.Optional(
+                CONF_MIN_SCAN_INTERVAL,
+                default=options.get(CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL)
+            ): vol.All(int, vol.Range(min=1)),
+            vol.Optional(
+                CONF_MAX_SCAN_INTERVAL,
+                default=options.get(CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL)
+            ): vol.All(int, vol.Range(min=1)),
+            vol.Optional(
+                CONF_STATISTICS_WINDOWS,
+                default=options.get(CONF_STATISTICS_WINDOWS, DEFAULT_STATISTICS_WINDOWS)
+            ): cv.multi_select(STATISTICS_WINDOW_OPTIONS),
+            vol.Optional(
+                CONF_PH_DEADBAND,
+                default=options.get(CONF_PH_DEADBAND, DEFAULT_PH_DEADBAND)
+            ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+            vol.Optional(
+                CONF_TEMP_DEADBAND,
+                default=options.get(CONF_TEMP_DEADBAND, DEFAULT_TEMP_DEADBAND)
+            ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+            vol.Optional(
+                CONF_CHLORINE_DEADBAND,
+                default=options.get(CONF_CHLORINE_DEADBAND, DEFAULT_CHLORINE_DEADBAND)
+            ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+            vol.Optional(
+                CONF_MIN_PUBLISH_INTERVAL,
+                default=options.get(CONF_MIN_PUBLISH_INTERVAL, DEFAULT_MIN_PUBLISH_INTERVAL)
+            ): vol.All(int, vol.Range(min=0)),
+            vol.Optional(
+                CONF_HEARTBEAT_INTERVAL,
+                default=options.get(CONF_HEARTBEAT_INTERVAL, DEFAULT_HEARTBEAT_INTERVAL)
+            ): vol.All(int, vol.Range(min=0)),
+            vol.Optional(
+                CONF_GRACE_FAILURES,
+                default=options.get(CONF_GRACE_FAILURES, DEFAULT_GRACE_FAILURES)
+            ): vol.All(int, vol.Range(min=1)),
+            vol.Optional(
+                CONF_GRACE_PERIOD,
+                default=options.get(CONF_GRACE_PERIOD, DEFAULT_GRACE_PERIOD)
+            ): vol.All(int, vol.Range(min=0)),
+            vol.Optional(
+                CONF_MAX_REQUEST_RATE,
+                default=options.get(CONF_MAX_REQUEST_RATE, DEFAULT_MAX_REQUEST_RATE)
+            ): vol.All(int, vol.Range(min=1)),
+            vol.Optional(
+                CONF_RECORD_TRAFFIC,
+                default=options.get(CONF_RECORD_TRAFFIC, DEFAULT_RECORD_TRAFFIC)
+            ): bool,
         })
 
         return self.async_show_form(step_id="init", data_schema=data_schema)
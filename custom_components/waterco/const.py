@@ -7,11 +7,81 @@ DOMAIN = "waterco"
 CONF_IP_ADDRESS = "ip_address"
 CONF_PORT = "port"
 CONF_SCAN_INTERVAL = "scan_interval"
+CONF_SCAN_MODE = "scan_mode"
+CONF_MIN_SCAN_INTERVAL = "min_scan_interval"
+CONF_MAX_SCAN_INTERVAL = "max_scan_interval"
+CONF_STATISTICS_WINDOWS = "statistics_windows"
+CONF_PH_DEADBAND = "ph_deadband"
+CONF_TEMP_DEADBAND = "temp_deadband"
+CONF_CHLORINE_DEADBAND = "chlorine_deadband"
+CONF_MIN_PUBLISH_INTERVAL = "min_publish_interval"
+CONF_HEARTBEAT_INTERVAL = "heartbeat_interval"
+CONF_GRACE_FAILURES = "unavailable_after_failures"
+CONF_GRACE_PERIOD = "unavailable_after_seconds"
+CONF_MAX_REQUEST_RATE = "max_requests_per_minute"
+CONF_RECORD_TRAFFIC = "record_traffic"
 DEFAULT_PORT = 90
 DEFAULT_SCAN_INTERVAL = 60
+DEFAULT_MIN_SCAN_INTERVAL = 10
+DEFAULT_MAX_SCAN_INTERVAL = 300
+DEFAULT_STATISTICS_WINDOWS = ["1", "24"]
+DEFAULT_PH_DEADBAND = 0.02
+DEFAULT_TEMP_DEADBAND = 0.2
+DEFAULT_CHLORINE_DEADBAND = 0.0
+DEFAULT_MIN_PUBLISH_INTERVAL = 0
+DEFAULT_HEARTBEAT_INTERVAL = 900
+DEFAULT_GRACE_FAILURES = 3
+DEFAULT_GRACE_PERIOD = 300
+DEFAULT_MAX_REQUEST_RATE = 60
+DEFAULT_RECORD_TRAFFIC = False
+
+SCAN_MODE_FIXED = "fixed"
+SCAN_MODE_ADAPTIVE = "adaptive"
+SCAN_MODES = [SCAN_MODE_FIXED, SCAN_MODE_ADAPTIVE]
 API_PATH = "/electrochlor"
 
+# The controller only documents reading pumpSpeed and lightColor. Setting them
+# assumes it accepts POSTs to API_PATH/pumpSpeed and API_PATH/lightColor like
+# its switch outputs, so those entities are disabled by default.
+# Assumed pump speed range, in RPM (typical for variable speed pool pumps).
+PUMP_SPEED_MIN = 600
+PUMP_SPEED_MAX = 3450
+PUMP_SPEED_STEP = 50
+
+# Assumed light colour names; colours the controller reports are added.
+LIGHT_COLOURS = ["White", "Blue", "Green", "Aqua", "Red", "Magenta", "Yellow", "Colour Cycle"]
+
+# Rolling statistics windows offered in the options flow, in hours.
+STATISTICS_WINDOW_OPTIONS = {
+    "1": "1 hour",
+    "6": "6 hours",
+    "24": "24 hours",
+    "168": "7 days",
+}
+
+ATTR_STALE = "stale"
+
+# hass.data key for the scheduler shared by all entries.
+DATA_SCHEDULER = f"{DOMAIN}_scheduler"
+# hass.data key for the per-model capability map shared by all entries.
+DATA_CAPABILITIES = f"{DOMAIN}_capabilities"
+
+# Dispatcher signal (formatted with the entry id) for coordinator diagnostics.
+SIGNAL_DIAGNOSTICS = f"{DOMAIN}_diagnostics_{{}}"
+# Dispatcher signal (formatted with the entry id) for new rolling statistics samples.
+SIGNAL_STATISTICS = f"{DOMAIN}_statistics_{{}}"
+# Dispatcher signal (formatted with the entry id) for changed run-time totals.
+SIGNAL_RUNTIME = f"{DOMAIN}_runtime_{{}}"
+# Dispatcher signal (formatted with the entry id) for newly reported payload keys.
+SIGNAL_CAPABILITIES = f"{DOMAIN}_capabilities_{{}}"
+
 # Use Home Assistant Platform constants consistently
-PLATFORMS = [Platform.SENSOR, Platform.SWITCH, Platform.BINARY_SENSOR]
+PLATFORMS = [
+    Platform.SENSOR,
+    Platform.SWITCH,
+    Platform.BINARY_SENSOR,
+    Platform.NUMBER,
+    Platform.SELECT,
+]
 
 LOGO = "mdi:water"
@@ -2,95 +2,500 @@
 from __future__ import annotations
 import asyncio
 import logging
+from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import timedelta
+from time import monotonic, time
 from typing import Any
 import aiohttp
 import async_timeout
 
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
+from homeassistant.util.json import json_loads
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.config_entries import ConfigEntry
 
 from .const import (
+    CONF_GRACE_FAILURES,
+    CONF_GRACE_PERIOD,
     CONF_IP_ADDRESS,
+    CONF_MAX_REQUEST_RATE,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
     CONF_PORT,
+    CONF_RECORD_TRAFFIC,
     CONF_SCAN_INTERVAL,
+    CONF_SCAN_MODE,
+    DEFAULT_GRACE_FAILURES,
+    DEFAULT_GRACE_PERIOD,
+    DEFAULT_MAX_REQUEST_RATE,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
     DEFAULT_PORT,
+    DEFAULT_RECORD_TRAFFIC,
     DEFAULT_SCAN_INTERVAL,
     API_PATH,
+    DOMAIN,
+    SCAN_MODE_ADAPTIVE,
+    SCAN_MODE_FIXED,
+    SIGNAL_CAPABILITIES,
+    SIGNAL_DIAGNOSTICS,
+    SIGNAL_RUNTIME,
+    SIGNAL_STATISTICS,
 )
+from .interval import AdaptiveInterval
+from .metrics import (
+    ERROR_CIRCUIT_OPEN,
+    ERROR_CONNECTION,
+    ERROR_HTTP_STATUS,
+    ERROR_INVALID_JSON,
+    ERROR_TIMEOUT,
+    PHASE_DECODE,
+    PHASE_FANOUT,
+    PipelineMetrics,
+)
+from .scheduler import ElectrochlorScheduler
+from .breaker import CircuitBreaker, CircuitOpenError
+from .capabilities import CapabilityMap, async_get_capability_map, reported_keys
+from .commands import CommandQueue
+from .publish import PublishPolicy, publish_policies
+from .ratelimit import TokenBucket
+from .runtime import RuntimeTracker
+from .snapshot import ElectrochlorSnapshot
+from .profiler import RefreshProfiler
+from .stats import PoolStatistics
+from .traffic import TrafficRecorder, traffic_log_path
+from .transport import ElectrochlorTransport
 
 _LOGGER = logging.getLogger(__name__)
-REQUEST_TIMEOUT = 10  # seconds
 
+# Burst polling backs off along these delays (seconds) and then holds the last one.
+BURST_DELAYS = (0.25, 0.5, 1.0, 2.0, 3.0)
+CONFIRM_TIMEOUT = 30  # seconds
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 30  # seconds
+
+
+@dataclass(slots=True)
+class WriteStats:
+    """Counters for state writes made and skipped by change detection."""
+
+    written: int = 0
+    suppressed: int = 0
+    unchanged_refreshes: int = 0
+
+
+@dataclass(slots=True)
+class RefreshStats:
+    """Counters for refresh requests merged into one in flight or rate limited."""
+
+    merged: int = 0
+    throttled: int = 0
+    throttled_seconds: float = 0.0
+
+
+def _interval_settings(entry: ConfigEntry) -> tuple[float, float, float, bool]:
+    """Read base/min/max scan intervals and adaptive mode from an entry."""
+    data = entry.data
+    options = entry.options
+    base = int(options.get(CONF_SCAN_INTERVAL, data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)))
+    minimum = int(options.get(CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL))
+    maximum = int(options.get(CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL))
+    adaptive = options.get(CONF_SCAN_MODE, SCAN_MODE_FIXED) == SCAN_MODE_ADAPTIVE
+    return base, minimum, maximum, adaptive
+
+
+def _grace_settings(entry: ConfigEntry) -> tuple[int, float]:
+    """Read how many failures and seconds entities ride out on the last snapshot."""
+    options = entry.options
+    failures = int(options.get(CONF_GRACE_FAILURES, DEFAULT_GRACE_FAILURES))
+    period = float(options.get(CONF_GRACE_PERIOD, DEFAULT_GRACE_PERIOD))
+    return failures, period
+
+
+def _request_rate(entry: ConfigEntry) -> float:
+    """Read the per-device request limit from an entry, in requests per second."""
+    return int(entry.options.get(CONF_MAX_REQUEST_RATE, DEFAULT_MAX_REQUEST_RATE)) / 60
+
+
+def _snapshot_store(hass: HomeAssistant, entry: ConfigEntry) -> Store[dict[str, Any]]:
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}")
 
-class ElectrochlorDataUpdateCoordinator(DataUpdateCoordinator):
+
+async def async_remove_stored_snapshot(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the last-known snapshot persisted for an entry."""
+    await _snapshot_store(hass, entry).async_remove()
+
+
+def _is_active(snapshot: ElectrochlorSnapshot) -> bool:
+    """Return True while the pump or the chlorinator cell is running."""
+    status = snapshot.status
+    return bool(
+        status.get("pump") or status.get("cellDirectionA") or status.get("cellDirectionB")
+    )
+
+
+class ElectrochlorDataUpdateCoordinator(DataUpdateCoordinator[ElectrochlorSnapshot]):
     """Coordinator for fetching data from Waterco Electrochlor."""
 
-    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+    def __init__(
+        self, hass: HomeAssistant, entry: ConfigEntry, scheduler: ElectrochlorScheduler
+    ) -> None:
         self.hass = hass
         self.entry = entry
+        self.scheduler = scheduler
         data = entry.data
-        options = entry.options
 
         self.ip_address: str = data.get(CONF_IP_ADDRESS)
         self.port: int = int(data.get(CONF_PORT, DEFAULT_PORT))
-        self._update_interval = timedelta(
-            seconds=int(
-                options.get(
-                    CONF_SCAN_INTERVAL, data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
-                )
-            )
-        )
+        self.interval = AdaptiveInterval(*_interval_settings(entry))
+        # Delay until the next poll as actually scheduled: the adaptive
+        # interval stretched onto this entry's phase.
+        self.scheduled_interval: float = self.interval.current
         self.api_url: str = f"http://{self.ip_address}:{self.port}{API_PATH}"
+        self.breaker = CircuitBreaker(on_change=self.async_publish_diagnostics)
+        self.metrics = PipelineMetrics()
+        self.transport = ElectrochlorTransport(
+            hass, self.ip_address, self.port, self.breaker, scheduler.semaphore, self.metrics
+        )
+        self.commands = CommandQueue(hass, entry, self.transport)
+        self.recorder: TrafficRecorder | None = None
+        if entry.options.get(CONF_RECORD_TRAFFIC, DEFAULT_RECORD_TRAFFIC):
+            self.recorder = TrafficRecorder(hass, traffic_log_path(hass, entry))
+            self.transport.recorder = self.recorder
+        self.write_stats = WriteStats()
+        self.refresh_stats = RefreshStats()
+        self.rate_limit = TokenBucket(_request_rate(entry))
+        # Options of the refresh in flight, and a future done when it ends.
+        self._refresh_inflight: tuple[tuple[bool, ...], asyncio.Future[None]] | None = None
+        # Set by the profile service while it records refresh cycles.
+        self.profiler: RefreshProfiler | None = None
+        self.statistics = PoolStatistics(hass, entry)
+        self.runtime = RuntimeTracker(hass, entry)
+        self.publish_policies: dict[str, PublishPolicy] = publish_policies(entry)
+        # Payload keys this controller (or its model) reports; entities are
+        # only created for keys in here.
+        self.capabilities: set[str] = set()
+        self._capability_map: CapabilityMap | None = None
+        self.grace_failures, self.grace_period = _grace_settings(entry)
+        self._last_success_at = hass.loop.time()
+        self._grace_unsub: CALLBACK_TYPE | None = None
+        self._notified_available = True
+        self._store = _snapshot_store(hass, entry)
+        self._last_body: bytes | None = None
+        self._expectations: list[
+            tuple[Callable[[ElectrochlorSnapshot], bool], asyncio.Future[bool]]
+        ] = []
+        self._burst_task: asyncio.Task[None] | None = None
+        self._burst_step = 0
 
+        # With always_update off, returning data equal to the previous
+        # snapshot skips the listener fan-out entirely.
         super().__init__(
             hass,
             _LOGGER,
             name=f"Electrochlor {self.ip_address}",
-            update_interval=self._update_interval,
+            update_interval=self.interval.timedelta,
+            always_update=False,
         )
 
     async def async_setup(self) -> None:
-        """Initial setup of the coordinator by fetching data once."""
+        """Initial setup of the coordinator.
+
+        With a stored snapshot, entities start from it (marked stale) and
+        the first live fetch runs in the background. Without one, setup
+        waits for a live fetch as before. Either way the first fetch waits
+        for its startup turn so controllers do not all poll at once.
+        """
+        self._capability_map = await async_get_capability_map(self.hass)
+        await self.statistics.async_load(time())
+        await self.runtime.async_load()
+        self.runtime.async_start(self._async_publish_runtime)
+        if self.recorder is not None:
+            self.recorder.async_start()
+        stored = await self._store.async_load()
+        if stored and isinstance(stored.get("payload"), dict):
+            self.data = ElectrochlorSnapshot.from_payload(stored["payload"], stale=True)
+            self._async_track_capabilities(self.data)
+            self.entry.async_create_background_task(
+                self.hass, self._async_initial_refresh(), f"{self.name} initial refresh"
+            )
+            return
+        await self._async_initial_refresh()
+
+    async def _async_initial_refresh(self) -> None:
+        await self.scheduler.async_startup_turn()
         await self.async_refresh()
 
-    async def _async_update_data(self) -> dict[str, Any]:
-        """Fetch data from the Electrochlor device."""
-        session = async_get_clientsession(self.hass)
+    @callback
+    def _data_to_store(self) -> dict[str, Any]:
+        return {"payload": self.data.raw if self.data else None}
+
+    async def _async_update_data(self) -> ElectrochlorSnapshot:
+        """Fetch data from the Electrochlor device and pick the next interval."""
+        try:
+            snapshot = await self._async_fetch_snapshot()
+        except UpdateFailed:
+            self._set_interval(self.interval.on_failure())
+            raise
+        self._last_success_at = self.hass.loop.time()
+        changed = snapshot is not self.data
+        if changed:
+            self._store.async_delay_save(self._data_to_store, SAVE_DELAY)
+            self._async_track_capabilities(snapshot)
+        self._set_interval(self.interval.on_success(_is_active(snapshot), changed))
+        now = time()
+        if self.statistics.add(snapshot, now):
+            async_dispatcher_send(self.hass, SIGNAL_STATISTICS.format(self.entry.entry_id))
+        if self.runtime.update(snapshot, now):
+            self._async_publish_runtime()
+        return snapshot
+
+    def supports(self, key: str) -> bool:
+        """Return True if the controller reports key, so its entities make sense."""
+        return key in self.capabilities
+
+    @callback
+    def _async_track_capabilities(self, snapshot: ElectrochlorSnapshot) -> None:
+        """Note the keys a snapshot reports and announce any new ones.
+
+        The first snapshot is seeded with what the model reported before,
+        so entities for keys that are briefly absent are still created.
+        """
+        keys = reported_keys(snapshot)
+        if self._capability_map is not None:
+            self._capability_map.add(snapshot.model, keys)
+            if not self.capabilities:
+                keys |= self._capability_map.keys(snapshot.model)
+        if keys <= self.capabilities:
+            return
+        self.capabilities |= keys
+        async_dispatcher_send(self.hass, SIGNAL_CAPABILITIES.format(self.entry.entry_id))
+
+    @property
+    def available(self) -> bool:
+        """Return True while entities should keep showing data.
+
+        After failed polls the last good snapshot is still served until
+        grace_failures consecutive polls have failed or grace_period seconds
+        have passed since the last success, whichever comes first.
+        """
+        if self.data is None:
+            return False
+        if self.last_update_success:
+            return True
+        return (
+            self.interval.failures < self.grace_failures
+            and self.hass.loop.time() - self._last_success_at < self.grace_period
+        )
+
+    @property
+    def is_stale(self) -> bool:
+        """Return True while serving a restored or last-good snapshot."""
+        return self.data is not None and (self.data.stale or not self.last_update_success)
+
+    async def _async_refresh(
+        self,
+        log_failures: bool = True,
+        raise_on_auth_failed: bool = False,
+        scheduled: bool = False,
+        raise_on_entry_error: bool = False,
+    ) -> None:
+        """Refresh once for every caller that asks while a refresh is in flight.
+
+        Scheduled polls, entity update requests and confirmation bursts all
+        land here. Callers arriving mid-refresh with the same options wait
+        for that refresh and see its result instead of starting another
+        request. Callers with other options, such as a scheduled poll or the
+        first refresh that must raise, wait for it to end and then refresh
+        with their own.
+        """
+        options = (log_failures, raise_on_auth_failed, scheduled, raise_on_entry_error)
+        while self._refresh_inflight is not None:
+            inflight_options, done = self._refresh_inflight
+            await asyncio.shield(done)
+            if inflight_options == options:
+                self.refresh_stats.merged += 1
+                return
+        done = self.hass.loop.create_future()
+        self._refresh_inflight = (options, done)
+        if (profiler := self.profiler) is not None:
+            profiler.start_cycle()
+        try:
+            await super()._async_refresh(*options)
+            self._async_check_availability()
+        finally:
+            if profiler is not None:
+                profiler.end_cycle()
+            self._refresh_inflight = None
+            done.set_result(None)
+
+    @callback
+    def _async_check_availability(self, _now: Any = None) -> None:
+        """Notify entities when the grace window runs out between refreshes.
+
+        The base coordinator only notifies when a poll first fails or
+        recovers, so the switch to unavailable after further failures, or
+        after the grace period with no poll at all, is pushed from here.
+        """
+        if self._grace_unsub is not None:
+            self._grace_unsub()
+            self._grace_unsub = None
+        available = self.available
+        if available and not self.last_update_success:
+            remaining = self.grace_period - (self.hass.loop.time() - self._last_success_at)
+            self._grace_unsub = async_call_later(
+                self.hass, max(0.0, remaining), self._async_check_availability
+            )
+        if available != self._notified_available:
+            self._notified_available = available
+            self.async_update_listeners()
+
+    async def _async_fetch_snapshot(self) -> ElectrochlorSnapshot:
+        if waited := await self.rate_limit.async_acquire():
+            self.refresh_stats.throttled += 1
+            self.refresh_stats.throttled_seconds += waited
         try:
-            async with async_timeout.timeout(REQUEST_TIMEOUT):
-                resp = await session.get(self.api_url)
-                resp.raise_for_status()
-                data = await resp.json()
+            body = await self.transport.async_get_status()
+        except CircuitOpenError as err:
+            self.metrics.record_error(ERROR_CIRCUIT_OPEN)
+            raise UpdateFailed(f"Skipping fetch from {self.api_url}: {err}") from err
         except asyncio.TimeoutError as err:
+            self.metrics.record_error(ERROR_TIMEOUT)
             raise UpdateFailed(f"Timeout fetching data from {self.api_url}") from err
         except aiohttp.ClientResponseError as err:
+            self.metrics.record_error(ERROR_HTTP_STATUS)
             raise UpdateFailed(f"HTTP error fetching data from {self.api_url}: {err.status}") from err
         except aiohttp.ClientError as err:
+            self.metrics.record_error(ERROR_CONNECTION)
             raise UpdateFailed(f"Connection error fetching data from {self.api_url}") from err
+
+        # An idle pool usually returns byte-identical JSON: skip decoding
+        # and hand back the cached snapshot so no listener is notified.
+        if self.data is not None and not self.data.stale and body == self._last_body:
+            return self._unchanged_snapshot(self.data)
+
+        start = monotonic()
+        try:
+            data = json_loads(body)
         except ValueError as err:
+            self.metrics.record_error(ERROR_INVALID_JSON)
             raise UpdateFailed("Received invalid JSON from device") from err
+        self.metrics.record_phase(PHASE_DECODE, monotonic() - start)
 
         if not isinstance(data, dict):
+            self.metrics.record_error(ERROR_INVALID_JSON)
             raise UpdateFailed("Unexpected data format from device: expected JSON object")
 
-        return data
+        self._last_body = body
+        if self.data is not None and not self.data.stale and self.data.raw == data:
+            return self._unchanged_snapshot(self.data)
+
+        snapshot = ElectrochlorSnapshot.from_payload(data)
+        self._resolve_expectations(snapshot)
+        return snapshot
+
+    def _unchanged_snapshot(self, snapshot: ElectrochlorSnapshot) -> ElectrochlorSnapshot:
+        self._resolve_expectations(snapshot)
+        self.write_stats.unchanged_refreshes += 1
+        _LOGGER.debug(
+            "Payload from %s unchanged (%s unchanged refreshes, %s entity writes suppressed)",
+            self.api_url,
+            self.write_stats.unchanged_refreshes,
+            self.write_stats.suppressed,
+        )
+        return snapshot
+
+    async def async_wait_for(
+        self,
+        check: Callable[[ElectrochlorSnapshot], bool],
+        timeout: float = CONFIRM_TIMEOUT,
+    ) -> bool:
+        """Fast-poll the device until check() holds for a fresh snapshot.
+
+        All waiters share one burst of refreshes, so concurrent commands do
+        not each run their own polling loop. Returns False on timeout.
+        """
+        future: asyncio.Future[bool] = self.hass.loop.create_future()
+        expectation = (check, future)
+        self._expectations.append(expectation)
+        self._burst_step = 0
+        if self._burst_task is None or self._burst_task.done():
+            self._burst_task = self.entry.async_create_background_task(
+                self.hass, self._async_burst(), f"{self.name} burst poll"
+            )
+        try:
+            async with async_timeout.timeout(timeout):
+                return await future
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._expectations.remove(expectation)
+
+    async def _async_burst(self) -> None:
+        """Refresh quickly with backoff while any expectation is pending."""
+        while self._expectations:
+            await asyncio.sleep(BURST_DELAYS[min(self._burst_step, len(BURST_DELAYS) - 1)])
+            self._burst_step += 1
+            if self._expectations:
+                await self.async_refresh()
+
+    def _resolve_expectations(self, snapshot: ElectrochlorSnapshot) -> None:
+        for check, future in self._expectations:
+            if not future.done() and check(snapshot):
+                future.set_result(True)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify entities, timing the fan-out."""
+        start = monotonic()
+        super().async_update_listeners()
+        self.metrics.record_phase(PHASE_FANOUT, monotonic() - start)
+
+    @callback
+    def _set_interval(self, seconds: float) -> None:
+        """Schedule the next poll about one interval out, on this entry's phase."""
+        self.scheduled_interval = self.scheduler.aligned_delay(self.entry.entry_id, seconds)
+        self.update_interval = timedelta(seconds=self.scheduled_interval)
+        self.async_publish_diagnostics()
+
+    @callback
+    def _async_publish_runtime(self) -> None:
+        async_dispatcher_send(self.hass, SIGNAL_RUNTIME.format(self.entry.entry_id))
+
+    @callback
+    def async_publish_diagnostics(self) -> None:
+        """Tell diagnostic entities that coordinator internals changed."""
+        async_dispatcher_send(self.hass, SIGNAL_DIAGNOSTICS.format(self.entry.entry_id))
 
     def update_from_entry(self, entry: ConfigEntry) -> None:
         """Update coordinator settings from updated config entry options."""
         data = entry.data
-        options = entry.options
 
         self.ip_address = data.get(CONF_IP_ADDRESS, self.ip_address)
         self.port = int(data.get(CONF_PORT, self.port))
-        self._update_interval = timedelta(
-            seconds=int(
-                options.get(
-                    CONF_SCAN_INTERVAL, data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
-                )
-            )
-        )
-        self.update_interval = self._update_interval
+        self.interval.configure(*_interval_settings(entry))
+        self.scheduled_interval = self.interval.current
+        self.update_interval = self.interval.timedelta
+        self.publish_policies = publish_policies(entry)
+        self.grace_failures, self.grace_period = _grace_settings(entry)
+        self.rate_limit.configure(_request_rate(entry))
         self.api_url = f"http://{self.ip_address}:{self.port}{API_PATH}"
+        self.transport.update_host(self.ip_address, self.port)
+
+    async def async_shutdown(self) -> None:
+        """Stop refreshing, save counters and close the device connection pool."""
+        await super().async_shutdown()
+        if self._grace_unsub is not None:
+            self._grace_unsub()
+            self._grace_unsub = None
+        await self.commands.async_shutdown()
+        await self.statistics.async_save()
+        await self.runtime.async_stop()
+        if self.recorder is not None:
+            await self.recorder.async_stop()
+        await self.transport.async_close()
@@ -1,4 +1,11 @@
 """Dynamic icon definitions for Waterco Electrochlor integration."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import cache
+from typing import Any
+
+DEFAULT_ICON = "mdi:help-circle"
 
 ICONS: dict[str, dict[str, str]] = {
     # Binary sensors / switches
@@ -87,3 +94,44 @@ ICONS: dict[str, dict[str, str]] = {
         "default": "mdi:alert",
     },
 }
+
+
+@dataclass(frozen=True, slots=True)
+class IconTable:
+    """Precompiled value to icon lookup for one entity key."""
+
+    default: str
+    on: str
+    off: str
+    values: dict[Any, str]
+
+    def for_state(self, state: bool) -> str:
+        return self.on if state else self.off
+
+    def for_value(self, value: Any) -> str:
+        """Return the icon for a sensor value, treating on/true and off/false as states."""
+        if isinstance(value, bool):
+            return self.for_state(value)
+        if isinstance(value, str):
+            word = value.lower()
+            if word in ("true", "on"):
+                return self.on
+            if word in ("false", "off"):
+                return self.off
+        try:
+            return self.values.get(value, self.default)
+        except TypeError:
+            return self.default
+
+
+@cache
+def icon_table(key: str) -> IconTable:
+    """Return the compiled icon table for a key in ICONS."""
+    icons = ICONS.get(key, {})
+    default = icons.get("default", DEFAULT_ICON)
+    return IconTable(
+        default=default,
+        on=icons.get("on", default),
+        off=icons.get("off", default),
+        values=dict(icons),
+    )
@@ -0,0 +1,64 @@
+"""Diagnostics support for Waterco Electrochlor integration."""
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_IP_ADDRESS, DOMAIN
+from .coordinator import ElectrochlorDataUpdateCoordinator
+
+TO_REDACT = {CONF_IP_ADDRESS, "title", "unique_id"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: ElectrochlorDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    snapshot = coordinator.data
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "last_update_success": coordinator.last_update_success,
+        "availability": {
+            "available": coordinator.available,
+            "stale": coordinator.is_stale,
+            "grace_failures": coordinator.grace_failures,
+            "grace_period": coordinator.grace_period,
+        },
+        "scan_interval": {
+            "current": coordinator.interval.current,
+            "scheduled": coordinator.scheduled_interval,
+            "adaptive": coordinator.interval.adaptive,
+            "consecutive_failures": coordinator.interval.failures,
+        },
+        "circuit_breaker": {
+            "state": coordinator.breaker.state.value,
+            "trips": coordinator.breaker.trips,
+            "failures": coordinator.breaker.failures,
+        },
+        "metrics": coordinator.metrics.as_dict(),
+        "commands": {
+            "queue_depth": coordinator.commands.depth,
+            **asdict(coordinator.commands.stats),
+            "average_latency": coordinator.commands.stats.average_latency,
+        },
+        "state_writes": asdict(coordinator.write_stats),
+        "refreshes": {
+            "max_per_minute": round(coordinator.rate_limit.rate * 60, 1),
+            **asdict(coordinator.refresh_stats),
+        },
+        "statistics": coordinator.statistics.as_dict(),
+        "runtime": coordinator.runtime.as_dict(),
+        "traffic_log": coordinator.recorder.as_dict() if coordinator.recorder else None,
+        "capabilities": sorted(coordinator.capabilities),
+        "snapshot": {
+            "stale": snapshot.stale,
+            "payload": snapshot.raw,
+        }
+        if snapshot
+        else None,
+    }
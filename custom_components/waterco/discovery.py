@@ -0,0 +1,96 @@
+"""Local network discovery of Waterco Electrochlor controllers."""
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+import logging
+from dataclasses import dataclass
+
+import aiohttp
+import async_timeout
+
+from homeassistant.components import network
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util.json import json_loads
+
+from .const import API_PATH, DEFAULT_PORT
+from .snapshot import ElectrochlorSnapshot
+
+_LOGGER = logging.getLogger(__name__)
+
+# Probes in flight at once and the time allowed per host; a silent /24
+# takes about ceil(254 / MAX_PROBES) * PROBE_TIMEOUT.
+MAX_PROBES = 64
+PROBE_TIMEOUT = 1.0  # seconds
+# Time allowed when checking a single chosen or announced host.
+VALIDATE_TIMEOUT = 5.0  # seconds
+# Larger networks are narrowed to the /24 around Home Assistant's address.
+MAX_SCAN_PREFIX = 24
+# Status documents are a few hundred bytes; anything much larger is not ours.
+MAX_PROBE_BYTES = 64 * 1024
+
+
+@dataclass(frozen=True, slots=True)
+class DiscoveredController:
+    """A host that answered like an Electrochlor controller."""
+
+    host: str
+    port: int
+    model: str | None
+
+
+async def async_probe(
+    hass: HomeAssistant, host: str, port: int = DEFAULT_PORT, timeout: float = PROBE_TIMEOUT
+) -> DiscoveredController | None:
+    """Return the controller at host:port, or None if it does not answer like one."""
+    session = async_get_clientsession(hass)
+    url = f"http://{host}:{port}{API_PATH}"
+    try:
+        async with async_timeout.timeout(timeout):
+            async with session.get(url, allow_redirects=False) as response:
+                if response.status != 200:
+                    return None
+                body = await response.content.read(MAX_PROBE_BYTES)
+    except (asyncio.TimeoutError, aiohttp.ClientError, OSError):
+        return None
+    try:
+        data = json_loads(body)
+    except ValueError:
+        return None
+    if not isinstance(data, dict) or not isinstance(data.get("result"), dict):
+        return None
+    return DiscoveredController(host, port, ElectrochlorSnapshot.from_payload(data).model)
+
+
+async def _async_scan_networks(hass: HomeAssistant) -> list[ipaddress.IPv4Network]:
+    networks: set[ipaddress.IPv4Network] = set()
+    for adapter in await network.async_get_adapters(hass):
+        if not adapter["enabled"]:
+            continue
+        for ipv4 in adapter["ipv4"]:
+            prefix = max(ipv4["network_prefix"], MAX_SCAN_PREFIX)
+            subnet = ipaddress.ip_network(f"{ipv4['address']}/{prefix}", strict=False)
+            if not subnet.is_loopback and not subnet.is_link_local:
+                networks.add(subnet)
+    return sorted(networks)
+
+
+async def async_discover(
+    hass: HomeAssistant, port: int = DEFAULT_PORT
+) -> list[DiscoveredController]:
+    """Probe every host on the local IPv4 subnets for a controller."""
+    semaphore = asyncio.Semaphore(MAX_PROBES)
+
+    async def _probe(host: str) -> DiscoveredController | None:
+        async with semaphore:
+            return await async_probe(hass, host, port)
+
+    hosts = [
+        str(address)
+        for subnet in await _async_scan_networks(hass)
+        for address in subnet.hosts()
+    ]
+    _LOGGER.debug("Probing %s hosts on port %s for Electrochlor controllers", len(hosts), port)
+    found = await asyncio.gather(*(_probe(host) for host in hosts))
+    return [controller for controller in found if controller is not None]
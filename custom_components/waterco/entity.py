@@ -0,0 +1,236 @@
+"""Base entity for Waterco Electrochlor integration."""
+from __future__ import annotations
+
+import logging
+from abc import abstractmethod
+from collections.abc import Callable, Iterable
+from datetime import datetime
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity import Entity, EntityDescription
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import ATTR_STALE, SIGNAL_CAPABILITIES
+from .coordinator import ElectrochlorDataUpdateCoordinator
+from .device_info import make_device_info
+from .snapshot import ElectrochlorSnapshot
+
+_LOGGER = logging.getLogger(__name__)
+
+# Quiet time after the last change (e.g. a slider drag step) before it is sent;
+# every change restarts it.
+COMMAND_DEBOUNCE = 0.75  # seconds
+
+_DescriptionT = TypeVar("_DescriptionT", bound=EntityDescription)
+
+
+@dataclass(frozen=True, kw_only=True)
+class ElectrochlorCommandDescriptionMixin:
+    """Description fields for an entity that sends commands to the controller."""
+
+    key: str
+    # Command path on the controller; defaults to the key.
+    command_key: str | None = None
+
+    @property
+    def command_path(self) -> str:
+        return self.command_key or self.key
+
+
+@callback
+def async_add_supported_entities(
+    coordinator: ElectrochlorDataUpdateCoordinator,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+    descriptions: Iterable[_DescriptionT],
+    factory: Callable[[_DescriptionT], Entity],
+    key: Callable[[_DescriptionT], str] = lambda description: description.key,
+) -> None:
+    """Add entities for the descriptions whose key the controller reports.
+
+    Descriptions for keys it does not report yet are kept back and added
+    as soon as a payload (e.g. after a firmware update) carries them.
+    """
+    pending = list(descriptions)
+
+    @callback
+    def _async_add_supported() -> None:
+        nonlocal pending
+        supported = [description for description in pending if coordinator.supports(key(description))]
+        if not supported:
+            return
+        pending = [description for description in pending if description not in supported]
+        async_add_entities(factory(description) for description in supported)
+
+    _async_add_supported()
+    if pending:
+        entry.async_on_unload(
+            async_dispatcher_connect(
+                coordinator.hass, SIGNAL_CAPABILITIES.format(entry.entry_id), _async_add_supported
+            )
+        )
+
+
+class ElectrochlorEntity(CoordinatorEntity[ElectrochlorDataUpdateCoordinator]):
+    """Coordinator entity that skips state writes when nothing it shows changed."""
+
+    # The stale flag comes and goes with restarts; keep it out of history.
+    _unrecorded_attributes = frozenset({ATTR_STALE})
+
+    _published: tuple[Any, ...] | None = None
+
+    def __init__(self, coordinator: ElectrochlorDataUpdateCoordinator, entry: ConfigEntry) -> None:
+        super().__init__(coordinator)
+        self._entry = entry
+
+    @property
+    def device_info(self):
+        return make_device_info(self._entry, self.coordinator.data)
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self._update_from_snapshot()
+
+    def _update_from_snapshot(self) -> None:
+        """Resolve the displayed state from the current snapshot once per refresh."""
+
+    @abstractmethod
+    def _state_signature(self) -> tuple[Any, ...]:
+        """Return the derived values that make up this entity's state."""
+
+    def _publish_signature(self) -> tuple[Any, ...]:
+        return (self.available, self.is_stale, *self._state_signature())
+
+    @property
+    def available(self) -> bool:
+        """Follow the coordinator's grace window rather than the last poll alone."""
+        return self.coordinator.available
+
+    @property
+    def is_stale(self) -> bool:
+        """Return True while showing a restored or last-good snapshot."""
+        return self.coordinator.is_stale
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        if self.is_stale:
+            return {ATTR_STALE: True}
+        return None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only if the derived value, icon or availability changed."""
+        self._update_from_snapshot()
+        self._async_write_if_changed()
+
+    @callback
+    def _async_write_if_changed(self) -> None:
+        stats = self.coordinator.write_stats
+        if self._publish_signature() == self._published:
+            stats.suppressed += 1
+            return
+        stats.written += 1
+        self.async_write_ha_state()
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Remember what was published so later refreshes can be compared."""
+        self._published = self._publish_signature()
+        super().async_write_ha_state()
+
+
+class ElectrochlorControlEntity(ElectrochlorEntity):
+    """Entity that sets one device value, debounced and confirmed by polling.
+
+    Changes show optimistically at once. Each change restarts a
+    COMMAND_DEBOUNCE timer and only the value left standing when it runs
+    out is queued. It is confirmed through the coordinator's shared burst
+    polling rather than a per-entity loop; a newer value abandons that wait.
+    """
+
+    def __init__(
+        self,
+        coordinator: ElectrochlorDataUpdateCoordinator,
+        entry: ConfigEntry,
+        key: str,
+        command_path: str,
+    ) -> None:
+        super().__init__(coordinator, entry)
+        self._key = key
+        self._command_path = command_path
+        self._attr_unique_id = f"{entry.entry_id}_{key}"
+        self._optimistic: Any = None
+        self._command_seq = 0
+        self._flush_unsub: CALLBACK_TYPE | None = None
+
+    def _read_value(self, snapshot: ElectrochlorSnapshot | None) -> Any:
+        return snapshot.get(self._key) if snapshot else None
+
+    def _current_value(self) -> Any:
+        if self._optimistic is not None:
+            return self._optimistic
+        return self._read_value(self.coordinator.data)
+
+    @property
+    def available(self) -> bool:
+        return self.coordinator.available and self._current_value() is not None
+
+    async def async_will_remove_from_hass(self) -> None:
+        self._async_cancel_flush()
+        await super().async_will_remove_from_hass()
+
+    async def _async_set_value(self, value: Any) -> None:
+        self._command_seq += 1
+        self._set_optimistic(value)
+        self._async_cancel_flush()
+        self._flush_unsub = async_call_later(self.hass, COMMAND_DEBOUNCE, self._async_flush)
+
+    @callback
+    def _async_cancel_flush(self) -> None:
+        if self._flush_unsub is not None:
+            self._flush_unsub()
+            self._flush_unsub = None
+
+    @callback
+    def _set_optimistic(self, value: Any) -> None:
+        self._optimistic = value
+        self._update_from_snapshot()
+        self.async_write_ha_state()
+
+    @callback
+    def _async_flush(self, _now: datetime) -> None:
+        """Queue the settled value; confirmation runs in its own task."""
+        self._flush_unsub = None
+        if self._optimistic is None:
+            return
+        self._entry.async_create_background_task(
+            self.hass,
+            self._async_send(self._optimistic, self._command_seq),
+            f"{self.entity_id} set {self._command_path}",
+        )
+
+    async def _async_send(self, value: Any, seq: int) -> None:
+        try:
+            sent = await self.coordinator.commands.async_send(self._command_path, value)
+        except HomeAssistantError as err:
+            _LOGGER.debug("%s not set to %s: %s", self.name, value, err)
+            sent = False
+        if sent and seq == self._command_seq:
+            # Stop waiting at the next poll once a newer value was set.
+            confirmed = await self.coordinator.async_wait_for(
+                lambda snapshot: seq != self._command_seq or self._read_value(snapshot) == value
+            )
+            if not confirmed and seq == self._command_seq:
+                _LOGGER.warning(
+                    "Polling timeout for %s; device did not report %s", self.name, value
+                )
+        # A newer value owns the optimistic state until it completes.
+        if seq == self._command_seq:
+            self._set_optimistic(None)
@@ -0,0 +1,60 @@
+"""Adaptive polling interval for Waterco Electrochlor integration."""
+from __future__ import annotations
+
+import random
+from datetime import timedelta
+
+# How much faster/slower each idle or failed poll moves the interval.
+IDLE_GROWTH = 1.5
+FAILURE_GROWTH = 2.0
+JITTER = 0.2
+
+
+class AdaptiveInterval:
+    """Work out the next scan interval from recent poll outcomes.
+
+    In fixed mode the configured interval is always used. In adaptive mode
+    consecutive failures back off exponentially with jitter, an active or
+    changing pool drops to the minimum interval, and an idle pool drifts
+    up towards the maximum.
+    """
+
+    def __init__(self, base: float, minimum: float, maximum: float, adaptive: bool) -> None:
+        self.configure(base, minimum, maximum, adaptive)
+
+    def configure(self, base: float, minimum: float, maximum: float, adaptive: bool) -> None:
+        """Apply new settings and restart from the configured interval."""
+        self.minimum = min(minimum, maximum)
+        self.maximum = max(minimum, maximum)
+        self.base = base
+        self.adaptive = adaptive
+        self.failures = 0
+        self.current = base
+
+    @property
+    def timedelta(self) -> timedelta:
+        return timedelta(seconds=self.current)
+
+    def _clamp(self, seconds: float) -> float:
+        return max(self.minimum, min(self.maximum, seconds))
+
+    def on_success(self, active: bool, changed: bool) -> float:
+        """Return the interval to use after a successful poll."""
+        self.failures = 0
+        if not self.adaptive:
+            self.current = self.base
+        elif active or changed:
+            self.current = self.minimum
+        else:
+            self.current = self._clamp(max(self.base, self.current * IDLE_GROWTH))
+        return self.current
+
+    def on_failure(self) -> float:
+        """Return the interval to use after a failed poll."""
+        self.failures += 1
+        if not self.adaptive:
+            self.current = self.base
+            return self.current
+        backoff = self.base * FAILURE_GROWTH ** (self.failures - 1)
+        self.current = self._clamp(backoff * random.uniform(1 - JITTER, 1 + JITTER))
+        return self.current
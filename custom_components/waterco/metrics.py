@@ -0,0 +1,114 @@
+"""Polling pipeline instrumentation for Waterco Electrochlor integration."""
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any
+
+# Histogram bucket upper bounds in milliseconds; the last bucket is open-ended.
+BUCKETS_MS = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+PHASE_CONNECT = "connect"
+PHASE_RESPONSE = "response"
+PHASE_DECODE = "decode"
+PHASE_FANOUT = "fanout"
+PHASES = (PHASE_CONNECT, PHASE_RESPONSE, PHASE_DECODE, PHASE_FANOUT)
+
+ERROR_TIMEOUT = "timeout"
+ERROR_HTTP_STATUS = "http_status"
+ERROR_CONNECTION = "connection"
+ERROR_INVALID_JSON = "invalid_json"
+ERROR_CIRCUIT_OPEN = "circuit_open"
+
+
+@dataclass(slots=True)
+class Histogram:
+    """Fixed-bucket timing histogram."""
+
+    buckets: list[int] = field(default_factory=lambda: [0] * (len(BUCKETS_MS) + 1))
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    last_ms: float | None = None
+
+    def record(self, seconds: float) -> None:
+        ms = seconds * 1000
+        self.buckets[bisect_left(BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+        self.last_ms = ms
+
+    @property
+    def mean_ms(self) -> float | None:
+        return self.total_ms / self.count if self.count else None
+
+    def percentile_ms(self, pct: float) -> float | None:
+        """Return the bucket upper bound holding the given percentile, capped at the max."""
+        if not self.count:
+            return None
+        rank = pct / 100 * self.count
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank and count:
+                if index < len(BUCKETS_MS):
+                    return min(float(BUCKETS_MS[index]), self.max_ms)
+                return self.max_ms
+        return self.max_ms
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean_ms": _round(self.mean_ms),
+            "p50_ms": _round(self.percentile_ms(50)),
+            "p95_ms": _round(self.percentile_ms(95)),
+            "max_ms": _round(self.max_ms),
+            "last_ms": _round(self.last_ms),
+        }
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            **self.summary(),
+            "buckets": dict(zip([*map(str, BUCKETS_MS), "inf"], self.buckets)),
+        }
+
+
+def _round(value: float | None) -> float | None:
+    return None if value is None else round(value, 2)
+
+
+@dataclass(slots=True)
+class PipelineMetrics:
+    """Timings, sizes and error counts for one controller's polling pipeline."""
+
+    phases: dict[str, Histogram] = field(
+        default_factory=lambda: {phase: Histogram() for phase in PHASES}
+    )
+    command_rtt: Histogram = field(default_factory=Histogram)
+    errors: Counter[str] = field(default_factory=Counter)
+    payload_bytes_last: int | None = None
+    payload_bytes_total: int = 0
+    responses: int = 0
+
+    def record_phase(self, phase: str, seconds: float) -> None:
+        self.phases[phase].record(seconds)
+
+    def record_payload(self, size: int) -> None:
+        self.responses += 1
+        self.payload_bytes_last = size
+        self.payload_bytes_total += size
+
+    def record_error(self, kind: str) -> None:
+        self.errors[kind] += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "phases": {phase: hist.as_dict() for phase, hist in self.phases.items()},
+            "command_rtt": self.command_rtt.as_dict(),
+            "errors": dict(self.errors),
+            "payload_bytes_last": self.payload_bytes_last,
+            "payload_bytes_total": self.payload_bytes_total,
+            "responses": self.responses,
+        }
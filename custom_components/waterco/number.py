@@ -0,0 +1,88 @@
+"""Number platform for Waterco Electrochlor integration."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from homeassistant.components.number import NumberEntity, NumberEntityDescription, NumberMode
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN, PUMP_SPEED_MAX, PUMP_SPEED_MIN, PUMP_SPEED_STEP
+from .coordinator import ElectrochlorDataUpdateCoordinator
+from .entity import (
+    ElectrochlorCommandDescriptionMixin,
+    ElectrochlorControlEntity,
+    async_add_supported_entities,
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class ElectrochlorNumberEntityDescription(
+    NumberEntityDescription, ElectrochlorCommandDescriptionMixin
+):
+    """Describes a numeric device setting."""
+
+
+NUMBER_DESCRIPTIONS: tuple[ElectrochlorNumberEntityDescription, ...] = (
+    ElectrochlorNumberEntityDescription(
+        key="pumpSpeed",
+        name="Pool Pump Speed",
+        icon="mdi:speedometer",
+        native_unit_of_measurement="RPM",
+        native_min_value=PUMP_SPEED_MIN,
+        native_max_value=PUMP_SPEED_MAX,
+        native_step=PUMP_SPEED_STEP,
+        mode=NumberMode.SLIDER,
+        # The write endpoint is assumed, see PUMP_SPEED_MIN.
+        entity_registry_enabled_default=False,
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
+) -> None:
+    """Set up Electrochlor numbers."""
+    coordinator: ElectrochlorDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    async_add_supported_entities(
+        coordinator,
+        entry,
+        async_add_entities,
+        NUMBER_DESCRIPTIONS,
+        lambda description: PoolNumber(coordinator, entry, description),
+    )
+
+
+class PoolNumber(ElectrochlorControlEntity, NumberEntity):
+    """Numeric setting such as pump speed, sent once a slider drag settles."""
+
+    entity_description: ElectrochlorNumberEntityDescription
+
+    def __init__(
+        self,
+        coordinator: ElectrochlorDataUpdateCoordinator,
+        entry: ConfigEntry,
+        description: ElectrochlorNumberEntityDescription,
+    ) -> None:
+        super().__init__(coordinator, entry, description.key, description.command_path)
+        self.entity_description = description
+
+    def _read_value(self, snapshot) -> Any:
+        value = super()._read_value(snapshot)
+        if value is None or isinstance(value, bool):
+            return None
+        try:
+            return int(float(value))
+        except (TypeError, ValueError):
+            return None
+
+    def _update_from_snapshot(self) -> None:
+        self._attr_native_value = self._current_value()
+
+    def _state_signature(self) -> tuple[Any, ...]:
+        return (self._attr_native_value,)
+
+    async def async_set_native_value(self, value: float) -> None:
+        await self._async_set_value(int(value))
@@ -0,0 +1,263 @@
+"""On-demand profiling of coordinator refresh cycles for Waterco Electrochlor integration."""
+from __future__ import annotations
+
+import asyncio
+import cProfile
+import logging
+import pstats
+import sys
+import threading
+import traceback
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import monotonic, time
+from typing import TYPE_CHECKING, Any
+
+import async_timeout
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .coordinator import ElectrochlorDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Functions listed per cycle in the report and the service response.
+TOP_FUNCTIONS = 10
+SUMMARY_FUNCTIONS = 3
+# Innermost frames kept for each blocked callback.
+STACK_DEPTH = 8
+
+
+@dataclass(slots=True)
+class CycleProfile:
+    """CPU profile of one refresh cycle."""
+
+    started_at: float
+    duration: float
+    stats: pstats.Stats
+
+    def hottest(self, count: int) -> list[dict[str, Any]]:
+        """Return the functions with the most own time, hottest first."""
+        rows = sorted(
+            self.stats.stats.items(),  # type: ignore[attr-defined]
+            key=lambda item: item[1][2],
+            reverse=True,
+        )
+        return [
+            {
+                "function": f"{name} ({Path(file).name}:{line})",
+                "calls": calls,
+                "own_ms": round(own * 1000, 3),
+                "cumulative_ms": round(cumulative * 1000, 3),
+            }
+            for (file, line, name), (_, calls, own, cumulative, _) in rows[:count]
+        ]
+
+
+@dataclass(slots=True)
+class LoopBlock:
+    """A stretch of time the event loop could not run other callbacks."""
+
+    at: float
+    duration: float
+    stack: list[str] = field(default_factory=list)
+
+
+class LoopBlockWatcher:
+    """Flag event loop callbacks that run longer than a threshold.
+
+    A heartbeat callback re-arms itself on the loop every half threshold.
+    A helper thread notices when it is overdue and captures the loop
+    thread's stack at that moment, which points at the code holding the
+    loop; the late heartbeat then records how long the block lasted.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, threshold: float) -> None:
+        self.threshold = threshold
+        self.interval = threshold / 2
+        self.blocks: list[LoopBlock] = []
+        self._loop = loop
+        self._loop_thread = threading.get_ident()
+        self._beat = 0.0
+        self._stack: list[str] | None = None
+        self._handle: asyncio.TimerHandle | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._arm(monotonic())
+        self._thread = threading.Thread(
+            target=self._watch, name=f"{DOMAIN} loop block watcher", daemon=True
+        )
+        self._thread.start()
+
+    def _arm(self, now: float) -> None:
+        self._beat = now
+        self._handle = self._loop.call_at(
+            self._loop.time() + self.interval, self._heartbeat, now + self.interval
+        )
+
+    def _heartbeat(self, expected: float) -> None:
+        now = monotonic()
+        if (late := now - expected) > self.threshold:
+            self.blocks.append(LoopBlock(time() - late, late, self._stack or []))
+        self._stack = None
+        self._arm(now)
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self.interval):
+            if self._stack is None and monotonic() - self._beat > self.interval + self.threshold:
+                if (frame := sys._current_frames().get(self._loop_thread)) is not None:
+                    self._stack = [
+                        line.rstrip() for line in traceback.format_stack(frame)[-STACK_DEPTH:]
+                    ]
+
+    def stop(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        self._stop.set()
+
+
+class RefreshProfiler:
+    """Profile the next few refresh cycles of one coordinator.
+
+    The coordinator brackets each refresh with start_cycle and end_cycle,
+    so a cycle covers the fetch, decoding and the entity fan-out. Other
+    work the loop runs while the fetch awaits the device is included too.
+    """
+
+    def __init__(self, hass: HomeAssistant, cycles: int, threshold: float) -> None:
+        self.cycles = cycles
+        self.results: list[CycleProfile] = []
+        self.watcher = LoopBlockWatcher(hass.loop, threshold)
+        self.done: asyncio.Future[None] = hass.loop.create_future()
+        self._profile: cProfile.Profile | None = None
+        self._started = 0.0
+        self._started_at = 0.0
+
+    def start_cycle(self) -> None:
+        if self.done.done():
+            return
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError as err:
+            # Another profiler (e.g. the profiler integration) is running.
+            self.done.set_exception(HomeAssistantError(f"Cannot start profiling: {err}"))
+            return
+        self._profile = profile
+        self._started = monotonic()
+        self._started_at = time()
+
+    def end_cycle(self) -> None:
+        if (profile := self._profile) is None:
+            return
+        profile.disable()
+        self._profile = None
+        self.results.append(
+            CycleProfile(self._started_at, monotonic() - self._started, pstats.Stats(profile))
+        )
+        if len(self.results) >= self.cycles and not self.done.done():
+            self.done.set_result(None)
+
+    def summary(self, count: int) -> dict[str, Any]:
+        return {
+            "cycles": [
+                {
+                    "duration_ms": round(result.duration * 1000, 3),
+                    "hottest": result.hottest(count),
+                }
+                for result in self.results
+            ],
+            "blocked": [
+                {
+                    "duration_ms": round(block.duration * 1000, 1),
+                    "where": block.stack[-1].splitlines()[0].strip() if block.stack else None,
+                }
+                for block in self.watcher.blocks
+            ],
+        }
+
+    def report(self, name: str) -> str:
+        """Render the plain-text report written next to the raw profile."""
+        lines = [
+            f"Profile of {name}: {len(self.results)} of {self.cycles} refresh cycles",
+            f"Loop blocks over {self.watcher.threshold * 1000:.0f} ms: {len(self.watcher.blocks)}",
+        ]
+        for index, result in enumerate(self.results, 1):
+            started = dt_util.as_local(dt_util.utc_from_timestamp(result.started_at))
+            lines += ["", f"Cycle {index} at {started.isoformat()}: {result.duration * 1000:.1f} ms"]
+            lines += [
+                f"  {row['own_ms']:>9.3f} ms own {row['cumulative_ms']:>9.3f} ms total "
+                f"{row['calls']:>6} calls  {row['function']}"
+                for row in result.hottest(TOP_FUNCTIONS)
+            ]
+        for block in self.watcher.blocks:
+            at = dt_util.as_local(dt_util.utc_from_timestamp(block.at))
+            lines += ["", f"Loop blocked {block.duration * 1000:.1f} ms at {at.isoformat()}"]
+            lines += block.stack or ["  (no stack captured)"]
+        return "\n".join(lines) + "\n"
+
+    def combined_stats(self) -> pstats.Stats | None:
+        if not self.results:
+            return None
+        stats = pstats.Stats()
+        stats.add(*(result.stats for result in self.results))
+        return stats
+
+
+def _write_report(base: Path, report: str, stats: pstats.Stats | None) -> None:
+    base.parent.mkdir(parents=True, exist_ok=True)
+    base.with_suffix(".txt").write_text(report, encoding="utf-8")
+    if stats is not None:
+        stats.dump_stats(base.with_suffix(".prof"))
+
+
+async def async_profile(
+    hass: HomeAssistant,
+    coordinator: ElectrochlorDataUpdateCoordinator,
+    cycles: int,
+    threshold: float,
+    timeout: float,
+) -> dict[str, Any]:
+    """Profile the coordinator's next refresh cycles and write a report.
+
+    Returns the report paths and a per-cycle summary. If fewer cycles run
+    within timeout, the report covers the ones that did.
+    """
+    if coordinator.profiler is not None:
+        raise HomeAssistantError(f"{coordinator.name} is already being profiled")
+    profiler = RefreshProfiler(hass, cycles, threshold)
+    coordinator.profiler = profiler
+    profiler.watcher.start()
+    try:
+        async with async_timeout.timeout(timeout):
+            await asyncio.shield(profiler.done)
+    except asyncio.TimeoutError:
+        _LOGGER.warning(
+            "Profiled %s of %s cycles of %s before timing out",
+            len(profiler.results),
+            cycles,
+            coordinator.name,
+        )
+    finally:
+        coordinator.profiler = None
+        profiler.watcher.stop()
+
+    stamp = dt_util.now().strftime("%Y%m%d-%H%M%S")
+    base = Path(hass.config.path(DOMAIN, f"profile-{coordinator.entry.entry_id}-{stamp}"))
+    await hass.async_add_executor_job(
+        _write_report, base, profiler.report(coordinator.name), profiler.combined_stats()
+    )
+    _LOGGER.info("Wrote profile of %s to %s.txt", coordinator.name, base)
+    return {
+        "report": str(base.with_suffix(".txt")),
+        "profile": str(base.with_suffix(".prof")) if profiler.results else None,
+        **profiler.summary(SUMMARY_FUNCTIONS),
+    }
@@ -0,0 +1,74 @@
+"""Significant-change rules for publishing Electrochlor readings."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+
+from .const import (
+    CONF_CHLORINE_DEADBAND,
+    CONF_HEARTBEAT_INTERVAL,
+    CONF_MIN_PUBLISH_INTERVAL,
+    CONF_PH_DEADBAND,
+    CONF_TEMP_DEADBAND,
+    DEFAULT_CHLORINE_DEADBAND,
+    DEFAULT_HEARTBEAT_INTERVAL,
+    DEFAULT_MIN_PUBLISH_INTERVAL,
+    DEFAULT_PH_DEADBAND,
+    DEFAULT_TEMP_DEADBAND,
+)
+
+# Reading -> (deadband option, default deadband).
+DEADBAND_OPTIONS: dict[str, tuple[str, float]] = {
+    "ph": (CONF_PH_DEADBAND, DEFAULT_PH_DEADBAND),
+    "temp": (CONF_TEMP_DEADBAND, DEFAULT_TEMP_DEADBAND),
+    "chlorineProduction": (CONF_CHLORINE_DEADBAND, DEFAULT_CHLORINE_DEADBAND),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class PublishPolicy:
+    """When a new reading is worth a state write."""
+
+    deadband: float = 0.0
+    min_interval: float = 0.0
+    heartbeat: float = 0.0
+
+    def delay(self, value: Any, published: Any, published_at: float, now: float) -> float | None:
+        """Return seconds until value should be published, or None to hold it.
+
+        A reading is published once it moves at least the deadband away
+        from the last published value, but no sooner than min_interval
+        after the last write. Smaller moves are held and published when the
+        heartbeat interval runs out, if one is set.
+        """
+        if value == published:
+            return None
+        since = now - published_at
+        if not _is_number(value) or not _is_number(published):
+            return 0.0
+        if abs(value - published) >= self.deadband:
+            return max(0.0, self.min_interval - since)
+        if self.heartbeat:
+            return max(0.0, self.heartbeat - since, self.min_interval - since)
+        return None
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def publish_policies(entry: ConfigEntry) -> dict[str, PublishPolicy]:
+    """Read per-reading publish policies from an entry's options."""
+    options = entry.options
+    min_interval = float(options.get(CONF_MIN_PUBLISH_INTERVAL, DEFAULT_MIN_PUBLISH_INTERVAL))
+    heartbeat = float(options.get(CONF_HEARTBEAT_INTERVAL, DEFAULT_HEARTBEAT_INTERVAL))
+    return {
+        key: PublishPolicy(
+            deadband=float(options.get(option, default)),
+            min_interval=min_interval,
+            heartbeat=heartbeat,
+        )
+        for key, (option, default) in DEADBAND_OPTIONS.items()
+    }
@@ -0,0 +1,50 @@
+"""Per-device request rate limiting for Waterco Electrochlor integration."""
+from __future__ import annotations
+
+import asyncio
+from time import monotonic
+
+# Requests allowed back to back before the steady rate applies, enough for
+# the first steps of a confirmation burst.
+BURST_CAPACITY = 5
+
+
+class TokenBucket:
+    """Allow rate requests per second on average, with short bursts.
+
+    The bucket holds up to capacity tokens and refills continuously. Each
+    request takes one token, waiting for the next one when it is empty.
+    """
+
+    def __init__(self, rate: float, capacity: int = BURST_CAPACITY) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = monotonic()
+
+    def configure(self, rate: float, capacity: int = BURST_CAPACITY) -> None:
+        self._refill()
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = min(self._tokens, float(capacity))
+
+    def _refill(self) -> None:
+        now = monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def delay(self) -> float:
+        """Return seconds until a token is available."""
+        self._refill()
+        if self._tokens >= 1:
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+    async def async_acquire(self) -> float:
+        """Take a token, waiting for one if needed; return the seconds waited."""
+        waited = 0.0
+        while (delay := self.delay()) > 0:
+            await asyncio.sleep(delay)
+            waited += delay
+        self._tokens -= 1
+        return waited
@@ -0,0 +1,224 @@
+"""Pump and chlorinator cell run-time accumulators."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, timedelta
+from time import time
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_change, async_track_time_interval
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .snapshot import ElectrochlorSnapshot
+
+# Counter -> status flags that mean it is running.
+RUNTIME_FLAGS: dict[str, tuple[str, ...]] = {
+    "pump": ("pump",),
+    "cell": ("cellDirectionA", "cellDirectionB"),
+    "cellDirectionA": ("cellDirectionA",),
+    "cellDirectionB": ("cellDirectionB",),
+}
+
+# A running period is closed at the last sighting if the device went unseen
+# for longer than this, e.g. while Home Assistant was stopped.
+MAX_GAP = 900  # seconds
+# How often running totals are republished (and saved) between on/off edges.
+PUBLISH_INTERVAL = timedelta(minutes=5)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 30  # seconds
+
+
+def _local_day(timestamp: float) -> date:
+    return dt_util.as_local(dt_util.utc_from_timestamp(timestamp)).date()
+
+
+def _start_of_day(timestamp: float) -> float:
+    return dt_util.start_of_local_day(_local_day(timestamp)).timestamp()
+
+
+@dataclass(slots=True)
+class RuntimeCounter:
+    """Seconds a device has run, integrated between on and off edges."""
+
+    lifetime: float = 0.0
+    today: float = 0.0
+    day: str | None = None
+    # Start of the open running period and the last time it was seen running.
+    since: float | None = None
+    last_seen: float | None = None
+
+    def update(self, running: bool, now: float) -> bool:
+        """Apply a status sample; return True if the totals jumped."""
+        changed = False
+        if self.since is not None:
+            if now - self.last_seen > MAX_GAP:
+                self._close(self.last_seen)
+                changed = True
+            elif not running:
+                self._close(now)
+                return True
+        if running:
+            self.last_seen = now
+            if self.since is None:
+                self.since = now
+                changed = True
+        return changed
+
+    def _close(self, end: float) -> None:
+        self._add(self.since, end)
+        self.since = None
+        self.last_seen = None
+
+    def _add(self, start: float, end: float) -> None:
+        self.lifetime += end - start
+        day = _local_day(end).isoformat()
+        if day != self.day:
+            self.day = day
+            self.today = 0.0
+        self.today += end - max(start, _start_of_day(end))
+
+    def extend(self, now: float) -> None:
+        """Count an open period as running up to now if seen within MAX_GAP.
+
+        Used just before midnight, so the day's last published total is not
+        short by the time since the last poll.
+        """
+        if self.since is not None and now - self.last_seen <= MAX_GAP:
+            self.last_seen = max(self.last_seen, now)
+
+    def roll_over(self, now: float) -> None:
+        """Start a new day, booking any open period to the old one.
+
+        A period seen running within MAX_GAP of midnight is booked up to
+        midnight, otherwise up to its last sighting, and continues from there.
+        """
+        midnight = _start_of_day(now)
+        if self.since is not None:
+            end = self.last_seen
+            if end < midnight <= end + MAX_GAP:
+                end = midnight
+            end = min(end, midnight)
+            if end > self.since:
+                old_day = _local_day(midnight - 1)
+                if self.day != old_day.isoformat():
+                    self.day = old_day.isoformat()
+                    self.today = 0.0
+                self.lifetime += end - self.since
+                self.today += max(0.0, end - max(self.since, _start_of_day(midnight - 1)))
+                self.since = end
+                self.last_seen = max(self.last_seen, end)
+        day = _local_day(now).isoformat()
+        if day != self.day:
+            self.day = day
+            self.today = 0.0
+
+    def totals(self, now: float) -> tuple[float, float]:
+        """Return (lifetime, today) in seconds including any open period.
+
+        An open period counts up to its last sighting, so totals never run
+        ahead of what a later off edge or gap will book.
+        """
+        lifetime, today = self.lifetime, self.today
+        if self.day != _local_day(now).isoformat():
+            today = 0.0
+        if self.since is not None:
+            lifetime += self.last_seen - self.since
+            today += max(0.0, self.last_seen - max(self.since, _start_of_day(now)))
+        return lifetime, today
+
+
+def _runtime_store(hass: HomeAssistant, entry: ConfigEntry) -> Store[dict[str, Any]]:
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.runtime")
+
+
+async def async_remove_stored_runtime(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the run-time counters persisted for an entry."""
+    await _runtime_store(hass, entry).async_remove()
+
+
+class RuntimeTracker:
+    """Run-time counters for one controller, persisted across restarts."""
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        self.hass = hass
+        self.counters = {key: RuntimeCounter() for key in RUNTIME_FLAGS}
+        self._store = _runtime_store(hass, entry)
+        self._unsubs: list[CALLBACK_TYPE] = []
+
+    async def async_load(self) -> None:
+        stored = await self._store.async_load()
+        for key, counter in (stored or {}).items():
+            if key in self.counters:
+                self.counters[key] = RuntimeCounter(**counter)
+
+    @callback
+    def async_start(self, on_change: Callable[[], None]) -> None:
+        """Republish running totals periodically, just before and at local midnight."""
+
+        @callback
+        def _tick(_now: datetime) -> None:
+            if any(counter.since is not None for counter in self.counters.values()):
+                # Save the last sighting so a restart can resume the open period.
+                self._store.async_delay_save(self._data_to_store, SAVE_DELAY)
+                on_change()
+
+        @callback
+        def _day_end(_now: datetime) -> None:
+            now = time()
+            for counter in self.counters.values():
+                counter.extend(now)
+            on_change()
+
+        @callback
+        def _midnight(_now: datetime) -> None:
+            now = time()
+            for counter in self.counters.values():
+                counter.roll_over(now)
+            self._store.async_delay_save(self._data_to_store, SAVE_DELAY)
+            on_change()
+
+        self._unsubs = [
+            async_track_time_interval(self.hass, _tick, PUBLISH_INTERVAL),
+            async_track_time_change(self.hass, _day_end, hour=23, minute=59, second=59),
+            async_track_time_change(self.hass, _midnight, hour=0, minute=0, second=0),
+        ]
+
+    @callback
+    def update(self, snapshot: ElectrochlorSnapshot, now: float) -> bool:
+        """Feed a live snapshot's status flags; return True on any edge."""
+        status = snapshot.status
+        edge = False
+        for key, flags in RUNTIME_FLAGS.items():
+            running = any(status.get(flag) for flag in flags)
+            edge |= self.counters[key].update(running, now)
+        if edge:
+            self._store.async_delay_save(self._data_to_store, SAVE_DELAY)
+        return edge
+
+    @callback
+    def _data_to_store(self) -> dict[str, Any]:
+        return {key: asdict(counter) for key, counter in self.counters.items()}
+
+    async def async_stop(self) -> None:
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs = []
+        await self._store.async_save(self._data_to_store())
+
+    def as_dict(self) -> dict[str, Any]:
+        now = time()
+        result = {}
+        for key, counter in self.counters.items():
+            lifetime, today = counter.totals(now)
+            result[key] = {
+                "lifetime_hours": round(lifetime / 3600, 3),
+                "today_hours": round(today / 3600, 3),
+                "running": counter.since is not None,
+            }
+        return result
@@ -0,0 +1,74 @@
+"""Integration-wide request scheduling for Waterco Electrochlor controllers."""
+from __future__ import annotations
+
+import asyncio
+import math
+
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_SCHEDULER, DOMAIN
+
+# Device requests allowed in flight across all controllers at once.
+MAX_CONCURRENT_REQUESTS = 4
+# Gap between initial refreshes at startup, squeezed so that all of them
+# start within STARTUP_WINDOW.
+STARTUP_SPACING = 0.5  # seconds
+STARTUP_WINDOW = 10  # seconds
+# Golden-ratio steps spread phases evenly without moving existing entries
+# when another controller is added.
+_PHASE_STEP = (math.sqrt(5) - 1) / 2
+
+
+class ElectrochlorScheduler:
+    """Share phase offsets, a request limit and startup pacing between entries."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self.semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        self._slots: dict[str, int] = {}
+        self._next_start = 0.0
+
+    def register(self, entry_id: str) -> None:
+        """Give an entry the lowest free phase slot."""
+        if entry_id in self._slots:
+            return
+        used = set(self._slots.values())
+        self._slots[entry_id] = next(slot for slot in range(len(used) + 1) if slot not in used)
+
+    def unregister(self, entry_id: str) -> None:
+        self._slots.pop(entry_id, None)
+
+    @property
+    def empty(self) -> bool:
+        return not self._slots
+
+    def phase_fraction(self, entry_id: str) -> float:
+        """Return the entry's phase as a fraction of its scan interval."""
+        return (self._slots.get(entry_id, 0) * _PHASE_STEP) % 1
+
+    def aligned_delay(self, entry_id: str, interval: float) -> float:
+        """Return a delay of roughly one interval that lands on the entry's phase."""
+        now = self.hass.loop.time()
+        offset = self.phase_fraction(entry_id) * interval
+        delay = interval - ((now - offset) % interval)
+        if delay < interval / 2:
+            delay += interval
+        return delay
+
+    async def async_startup_turn(self) -> None:
+        """Wait for this entry's turn to make its first device request."""
+        count = max(1, len(self.hass.config_entries.async_entries(DOMAIN)))
+        spacing = min(STARTUP_SPACING, STARTUP_WINDOW / count)
+        now = self.hass.loop.time()
+        start = max(now, self._next_start)
+        self._next_start = start + spacing
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
+def async_get_scheduler(hass: HomeAssistant) -> ElectrochlorScheduler:
+    """Return the integration's shared scheduler, creating it if needed."""
+    scheduler: ElectrochlorScheduler | None = hass.data.get(DATA_SCHEDULER)
+    if scheduler is None:
+        scheduler = hass.data[DATA_SCHEDULER] = ElectrochlorScheduler(hass)
+    return scheduler
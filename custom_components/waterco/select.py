@@ -0,0 +1,80 @@
+"""Select platform for Waterco Electrochlor integration."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from homeassistant.components.select import SelectEntity, SelectEntityDescription
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN, LIGHT_COLOURS
+from .coordinator import ElectrochlorDataUpdateCoordinator
+from .entity import (
+    ElectrochlorCommandDescriptionMixin,
+    ElectrochlorControlEntity,
+    async_add_supported_entities,
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class ElectrochlorSelectEntityDescription(
+    SelectEntityDescription, ElectrochlorCommandDescriptionMixin
+):
+    """Describes a device setting chosen from a list."""
+
+
+SELECT_DESCRIPTIONS: tuple[ElectrochlorSelectEntityDescription, ...] = (
+    ElectrochlorSelectEntityDescription(
+        key="lightColor",
+        name="Pool Light Colour",
+        icon="mdi:palette-outline",
+        options=LIGHT_COLOURS,
+        # The write endpoint is assumed, see LIGHT_COLOURS.
+        entity_registry_enabled_default=False,
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
+) -> None:
+    """Set up Electrochlor selects."""
+    coordinator: ElectrochlorDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    async_add_supported_entities(
+        coordinator,
+        entry,
+        async_add_entities,
+        SELECT_DESCRIPTIONS,
+        lambda description: PoolSelect(coordinator, entry, description),
+    )
+
+
+class PoolSelect(ElectrochlorControlEntity, SelectEntity):
+    """Setting chosen from a list, such as the light colour."""
+
+    entity_description: ElectrochlorSelectEntityDescription
+
+    def __init__(
+        self,
+        coordinator: ElectrochlorDataUpdateCoordinator,
+        entry: ConfigEntry,
+        description: ElectrochlorSelectEntityDescription,
+    ) -> None:
+        super().__init__(coordinator, entry, description.key, description.command_path)
+        self.entity_description = description
+        self._attr_options = list(description.options or [])
+
+    def _update_from_snapshot(self) -> None:
+        current = self._current_value()
+        # Keep colours the controller reports even if they are not in our list.
+        if current is not None and current not in self._attr_options:
+            self._attr_options = [*self._attr_options, current]
+        self._attr_current_option = current
+
+    def _state_signature(self) -> tuple[Any, ...]:
+        return (self._attr_current_option, tuple(self._attr_options))
+
+    async def async_select_option(self, option: str) -> None:
+        await self._async_set_value(option)
@@ -2,48 +2,316 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+from time import time
 from typing import Any
 
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.helpers.event import async_call_later
 
-from .const import DOMAIN
+from .const import DOMAIN, SIGNAL_DIAGNOSTICS, SIGNAL_RUNTIME, SIGNAL_STATISTICS
 from .coordinator import ElectrochlorDataUpdateCoordinator
-from .device_info import make_device_info
-from .device_icons import ICONS
+from .entity import ElectrochlorEntity, async_add_supported_entities
+from .metrics import (
+    ERROR_CIRCUIT_OPEN,
+    ERROR_CONNECTION,
+    ERROR_HTTP_STATUS,
+    ERROR_INVALID_JSON,
+    ERROR_TIMEOUT,
+    PHASE_CONNECT,
+    PHASE_DECODE,
+    PHASE_FANOUT,
+    PHASE_RESPONSE,
+)
+from .device_icons import icon_table
+from .snapshot import ElectrochlorSnapshot
+from .stats import RollingWindow
 
 _LOGGER = logging.getLogger(__name__)
 
-SENSOR_CONFIG: list[dict[str, Any]] = [
-    {"key": "temp", "name": "Pool Temperature", "unit": "°C", "round": 1},
-    {"key": "ph", "name": "Pool pH", "unit": "pH", "round": 2},
-    {"key": "chlorineProduction", "name": "Pool Chlorine Production"},
-    {"key": "operation", "name": "Pool Operation Mode"},
-    {"key": "operationType", "name": "Pool Operation Type"},
-    {"key": "pumpSpeed", "name": "Pool Pump Speed", "unit": "RPM"},
-    {"key": "lightColor", "name": "Pool Light Colour"},
-    {"key": "saltStatus", "name": "Pool Salt Status"},
-    {"key": "error", "name": "Pool Chlorinator Status", "special": "error"},
-    {"key": "status", "name": "Pool Chlorinator Cell Direction", "special": "cell_direction"},
-]
-
-
-def find_key(data: dict[str, Any], target_key: str) -> Any:
-    """
-    Recursively search for a key in nested dictionaries.
-    Returns the value if found, else None.
-    """
-    if isinstance(data, dict):
-        if target_key in data:
-            return data[target_key]
-        for value in data.values():
-            found = find_key(value, target_key)
-            if found is not None:
-                return found
-    return None
+@dataclass(frozen=True, kw_only=True)
+class ElectrochlorSensorEntityDescription(SensorEntityDescription):
+    """Describes an Electrochlor reading."""
+
+    # Rounding applied to numeric readings.
+    digits: int | None = None
+    # Special extractor replacing the plain result lookup.
+    value_fn: Callable[[ElectrochlorSnapshot | None], Any] | None = None
+    # ICONS entry to use when it differs from the key.
+    icon_key: str | None = None
+
+
+@dataclass(frozen=True, kw_only=True)
+class ElectrochlorDiagnosticSensorEntityDescription(SensorEntityDescription):
+    """Describes a sensor exposing coordinator internals."""
+
+    value_fn: Callable[[ElectrochlorDataUpdateCoordinator], Any]
+    attributes_fn: Callable[[ElectrochlorDataUpdateCoordinator], dict[str, Any]] | None = None
+    entity_category: EntityCategory | None = EntityCategory.DIAGNOSTIC
+
+
+def _error_value(snapshot: ElectrochlorSnapshot | None) -> str:
+    return "Error" if snapshot and snapshot.get("error") else "OK"
+
+
+def _cell_direction_value(snapshot: ElectrochlorSnapshot | None) -> str:
+    status = snapshot.status if snapshot else {}
+    if status.get("cellDirectionA"):
+        return "A"
+    if status.get("cellDirectionB"):
+        return "B"
+    return "Off"
+
+
+SENSOR_DESCRIPTIONS: tuple[ElectrochlorSensorEntityDescription, ...] = (
+    ElectrochlorSensorEntityDescription(
+        key="temp", name="Pool Temperature", native_unit_of_measurement="°C", digits=1
+    ),
+    ElectrochlorSensorEntityDescription(
+        key="ph", name="Pool pH", native_unit_of_measurement="pH", digits=2
+    ),
+    ElectrochlorSensorEntityDescription(key="chlorineProduction", name="Pool Chlorine Production"),
+    ElectrochlorSensorEntityDescription(key="operation", name="Pool Operation Mode"),
+    ElectrochlorSensorEntityDescription(key="operationType", name="Pool Operation Type"),
+    ElectrochlorSensorEntityDescription(
+        key="pumpSpeed", name="Pool Pump Speed", native_unit_of_measurement="RPM"
+    ),
+    ElectrochlorSensorEntityDescription(key="lightColor", name="Pool Light Colour"),
+    ElectrochlorSensorEntityDescription(key="saltStatus", name="Pool Salt Status"),
+    ElectrochlorSensorEntityDescription(
+        key="error", name="Pool Chlorinator Status", value_fn=_error_value, icon_key="error_sensor"
+    ),
+    ElectrochlorSensorEntityDescription(
+        key="status", name="Pool Chlorinator Cell Direction", value_fn=_cell_direction_value
+    ),
+)
+
+DIAGNOSTIC_SENSOR_DESCRIPTIONS: tuple[ElectrochlorDiagnosticSensorEntityDescription, ...] = (
+    ElectrochlorDiagnosticSensorEntityDescription(
+        key="effective_scan_interval",
+        name="Pool Effective Scan Interval",
+        native_unit_of_measurement="s",
+        icon="mdi:timer-sync-outline",
+        value_fn=lambda coordinator: round(coordinator.scheduled_interval),
+    ),
+    ElectrochlorDiagnosticSensorEntityDescription(
+        key="circuit_breaker",
+        name="Pool Connection Breaker",
+        icon="mdi:electric-switch",
+        value_fn=lambda coordinator: coordinator.breaker.state.value,
+    ),
+    ElectrochlorDiagnosticSensorEntityDescription(
+        key="circuit_breaker_trips",
+        name="Pool Connection Breaker Trips",
+        icon="mdi:counter",
+        value_fn=lambda coordinator: coordinator.breaker.trips,
+    ),
+    ElectrochlorDiagnosticSensorEntityDescription(
+        key="refresh_connect_time",
+        name="Pool Refresh Connect Time",
+        native_unit_of_measurement="ms",
+        icon="mdi:timer-outline",
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: _round(coordinator.metrics.phases[PHASE_CONNECT].mean_ms),
+        attributes_fn=lambda coordinator: coordinator.metrics.phases[PHASE_CONNECT].summary(),
+    ),
+    ElectrochlorDiagnosticSensorEntityDescription(
+        key="refresh_response_time",
+        name="Pool Refresh Response Time",
+        native_unit_of_measurement="ms",
+        icon="mdi:timer-outline",
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: _round(coordinator.metrics.phases[PHASE_RESPONSE].mean_ms),
+        attributes_fn=lambda coordinator: coordinator.metrics.phases[PHASE_RESPONSE].summary(),
+    ),
+    ElectrochlorDiagnosticSensorEntityDescription(
+        key="refresh_decode_time",
+        name="Pool Refresh Decode Time",
+        native_unit_of_measurement="ms",
+        icon="mdi:timer-outline",
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: _round(coordinator.metrics.phases[PHASE_DECODE].mean_ms),
+        attributes_fn=lambda coordinator: coordinator.metrics.phases[PHASE_DECODE].summary(),
+    ),
+    ElectrochlorDiagnosticSensorEntityDescription(
+        key="refresh_fanout_time",
+        name="Pool Refresh Entity Update Time",
+        native_unit_of_measurement="ms",
+        icon="mdi:timer-outline",
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: _round(coordinator.metrics.phases[PHASE_FANOUT].mean_ms),
+        attributes_fn=lambda coordinator: coordinator.metrics.phases[PHASE_FANOUT].summary(),
+    ),
+    ElectrochlorDiagnosticSensorEntityDescription(
+        key="payload_size",
+        name="Pool Payload Size",
+        native_unit_of_measurement="B",
+        icon="mdi:file-outline",
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: coordinator.metrics.payload_bytes_last,
+        attributes_fn=lambda coordinator: {
+            "responses": coordinator.metrics.responses,
+            "total_bytes": coordinator.metrics.payload_bytes_total,
+        },
+    ),
+    ElectrochlorDiagnosticSensorEntityDescription(
+        key="refresh_requests_merged",
+        name="Pool Refresh Requests Merged",
+        icon="mdi:call-merge",
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: coordinator.refresh_stats.merged,
+    ),
+    ElectrochlorDiagnosticSensorEntityDescription(
+        key="refresh_requests_throttled",
+        name="Pool Refresh Requests Throttled",
+        icon="mdi:speedometer-slow",
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: coordinator.refresh_stats.throttled,
+        attributes_fn=lambda coordinator: {
+            "max_per_minute": round(coordinator.rate_limit.rate * 60, 1),
+            "seconds_waited": round(coordinator.refresh_stats.throttled_seconds, 1),
+        },
+    ),
+    ElectrochlorDiagnosticSensorEntityDescription(
+        key="refresh_errors",
+        name="Pool Refresh Errors",
+        icon="mdi:alert-circle-outline",
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: sum(coordinator.metrics.errors.values()),
+        attributes_fn=lambda coordinator: dict(coordinator.metrics.errors),
+    ),
+    ElectrochlorDiagnosticSensorEntityDescription(
+        key="command_round_trip",
+        name="Pool Command Round Trip",
+        native_unit_of_measurement="ms",
+        icon="mdi:swap-horizontal",
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: _round(coordinator.metrics.command_rtt.mean_ms),
+        attributes_fn=lambda coordinator: {
+            **coordinator.metrics.command_rtt.summary(),
+            "queue_depth": coordinator.commands.depth,
+            "max_queue_depth": coordinator.commands.stats.max_depth,
+            "coalesced": coordinator.commands.stats.coalesced,
+            "failed": coordinator.commands.stats.failed,
+        },
+    ),
+    ElectrochlorDiagnosticSensorEntityDescription(
+        key="suppressed_state_writes",
+        name="Pool Suppressed State Writes",
+        icon="mdi:content-save-off-outline",
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: coordinator.write_stats.suppressed,
+        attributes_fn=lambda coordinator: {
+            "written": coordinator.write_stats.written,
+            "unchanged_refreshes": coordinator.write_stats.unchanged_refreshes,
+        },
+    ),
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class ElectrochlorStatisticsSensorEntityDescription(SensorEntityDescription):
+    """Describes one rolling statistic of a reading over a window."""
+
+    source: str
+    hours: int
+    value_fn: Callable[[RollingWindow], float | None]
+    digits: int
+    state_class: SensorStateClass | None = SensorStateClass.MEASUREMENT
+
+
+# Reading -> (name, unit, digits) for the statistics sensors.
+STATISTICS_SOURCES: dict[str, tuple[str, str | None, int]] = {
+    "ph": ("pH", "pH", 3),
+    "temp": ("Temperature", "°C", 2),
+    "chlorineProduction": ("Chlorine Production", None, 1),
+}
+
+# Statistic -> (name, per-hour unit, enabled by default, value).
+STATISTICS: dict[str, tuple[str, bool, bool, Callable[[RollingWindow], float | None]]] = {
+    "mean": ("Mean", False, True, lambda window: window.mean),
+    "min": ("Min", False, False, lambda window: window.minimum),
+    "max": ("Max", False, False, lambda window: window.maximum),
+    "stddev": ("Std Dev", False, False, lambda window: window.stddev),
+    "rate": ("Rate", True, True, lambda window: window.rate),
+}
+
+
+def statistics_descriptions(
+    hours: tuple[int, ...],
+) -> list[ElectrochlorStatisticsSensorEntityDescription]:
+    """Build a description per reading, window and statistic."""
+    descriptions = []
+    for source, (label, unit, digits) in STATISTICS_SOURCES.items():
+        for window in hours:
+            for stat, (stat_label, per_hour, enabled, value_fn) in STATISTICS.items():
+                if per_hour:
+                    stat_unit = f"{unit}/h" if unit else None
+                else:
+                    stat_unit = unit
+                descriptions.append(
+                    ElectrochlorStatisticsSensorEntityDescription(
+                        key=f"{source}_{window}h_{stat}",
+                        name=f"Pool {label} {window}h {stat_label}",
+                        native_unit_of_measurement=stat_unit,
+                        icon="mdi:chart-bell-curve" if stat == "stddev" else "mdi:chart-line",
+                        entity_registry_enabled_default=enabled,
+                        source=source,
+                        hours=window,
+                        value_fn=value_fn,
+                        digits=digits,
+                    )
+                )
+    return descriptions
+
+
+@dataclass(frozen=True, kw_only=True)
+class ElectrochlorRuntimeSensorEntityDescription(SensorEntityDescription):
+    """Describes a lifetime or daily run-time counter."""
+
+    counter: str
+    daily: bool = False
+    device_class: SensorDeviceClass | None = SensorDeviceClass.DURATION
+    native_unit_of_measurement: str | None = UnitOfTime.HOURS
+    state_class: SensorStateClass | None = SensorStateClass.TOTAL_INCREASING
+    suggested_display_precision: int | None = 2
+
+
+# Counter -> (name, icon) for the run-time sensors.
+RUNTIME_SENSORS: dict[str, tuple[str, str]] = {
+    "pump": ("Pool Pump Runtime", "mdi:pump"),
+    "cell": ("Pool Chlorinator Cell Hours", "mdi:timer-cog-outline"),
+    "cellDirectionA": ("Pool Chlorinator Cell Direction A Hours", "mdi:alpha-a-circle"),
+    "cellDirectionB": ("Pool Chlorinator Cell Direction B Hours", "mdi:alpha-b-circle"),
+}
+
+RUNTIME_SENSOR_DESCRIPTIONS: tuple[ElectrochlorRuntimeSensorEntityDescription, ...] = tuple(
+    ElectrochlorRuntimeSensorEntityDescription(
+        key=f"{counter}_runtime_today" if daily else f"{counter}_runtime",
+        name=f"{name} Today" if daily else name,
+        icon=icon,
+        counter=counter,
+        daily=daily,
+    )
+    for counter, (name, icon) in RUNTIME_SENSORS.items()
+    for daily in (False, True)
+)
+
+
+def _round(value: float | None) -> float | None:
+    return None if value is None else round(value, 1)
 
 
 async def async_setup_entry(
@@ -51,77 +319,283 @@ async def async_setup_entry(
 ) -> None:
     """Set up Electrochlor sensors."""
     coordinator: ElectrochlorDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
-    sensors = [GenericPoolSensor(coordinator, entry, cfg) for cfg in SENSOR_CONFIG]
+    async_add_supported_entities(
+        coordinator,
+        entry,
+        async_add_entities,
+        SENSOR_DESCRIPTIONS,
+        lambda description: GenericPoolSensor(coordinator, entry, description),
+    )
+    async_add_supported_entities(
+        coordinator,
+        entry,
+        async_add_entities,
+        statistics_descriptions(coordinator.statistics.hours),
+        lambda description: PoolStatisticsSensor(coordinator, entry, description),
+        key=lambda description: description.source,
+    )
+    sensors: list[SensorEntity] = [
+        PoolDiagnosticSensor(coordinator, entry, description)
+        for description in DIAGNOSTIC_SENSOR_DESCRIPTIONS
+    ]
+    sensors.extend(
+        PoolRuntimeSensor(coordinator, entry, description)
+        for description in RUNTIME_SENSOR_DESCRIPTIONS
+    )
     async_add_entities(sensors)
 
 
-class GenericPoolSensor(CoordinatorEntity[ElectrochlorDataUpdateCoordinator], SensorEntity):
+class GenericPoolSensor(ElectrochlorEntity, SensorEntity):
     """Generic pool sensor entity with dynamic icons and auto key detection."""
 
+    entity_description: ElectrochlorSensorEntityDescription
+
     def __init__(
         self,
         coordinator: ElectrochlorDataUpdateCoordinator,
         entry: ConfigEntry,
-        config: dict[str, Any],
+        description: ElectrochlorSensorEntityDescription,
     ) -> None:
-        super().__init__(coordinator)
-        self._entry = entry
-        self.config = config
-        self._attr_name = config["name"]
-        self._attr_unique_id = f"{entry.entry_id}_{config['key']}"
-        self._attr_native_unit_of_measurement = config.get("unit")
+        super().__init__(coordinator, entry)
+        self.entity_description = description
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+        self._icons = icon_table(description.icon_key or description.key)
+        self._published_value: Any = None
+        self._published_at = 0.0
+        self._pending: CALLBACK_TYPE | None = None
+
+    def _update_from_snapshot(self) -> None:
+        """Resolve the reading and its icon from the current snapshot."""
+        snapshot = self.coordinator.data
+        description = self.entity_description
+
+        if description.value_fn is not None:
+            value = description.value_fn(snapshot)
+        else:
+            value = snapshot.get(description.key) if snapshot else None
+            if value is None:
+                _LOGGER.debug(
+                    "Sensor %s (%s) is unavailable, data: %s", self.name, description.key, snapshot
+                )
+                value = "unavailable"
+            elif description.digits is not None and isinstance(value, (int, float)):
+                value = round(value, description.digits)
+
+        self._attr_native_value = value
+        self._attr_icon = self._icons.for_value(value)
+
+    def _state_signature(self) -> tuple[Any, ...]:
+        return (self._attr_native_value, self._attr_icon)
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(self._async_cancel_pending)
+
+    @callback
+    def _async_write_if_changed(self) -> None:
+        """Hold readings that have not moved past the deadband since the last write."""
+        policy = self.coordinator.publish_policies.get(self.entity_description.key)
+        if (
+            policy is not None
+            and self._published is not None
+            and self._published[:2] == (self.available, self.is_stale)
+        ):
+            delay = policy.delay(
+                self._attr_native_value,
+                self._published_value,
+                self._published_at,
+                self.hass.loop.time(),
+            )
+            if delay != 0:
+                self._async_cancel_pending()
+                if delay is not None:
+                    self._pending = async_call_later(self.hass, delay, self._async_publish_pending)
+                self.coordinator.write_stats.suppressed += 1
+                return
+        super()._async_write_if_changed()
+
+    @callback
+    def _async_publish_pending(self, _now: datetime) -> None:
+        self._pending = None
+        super()._async_write_if_changed()
+
+    @callback
+    def _async_cancel_pending(self) -> None:
+        if self._pending is not None:
+            self._pending()
+            self._pending = None
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        self._async_cancel_pending()
+        self._published_value = self._attr_native_value
+        self._published_at = self.hass.loop.time()
+        super().async_write_ha_state()
+
+    async def async_update(self) -> None:
+        await self.coordinator.async_request_refresh()
 
-    @property
-    def native_value(self) -> Any:
-        """Return the sensor's current state using auto key detection."""
-        data = self.coordinator.data or {}
-        key = self.config["key"]
-        special = self.config.get("special")
 
-        if special == "error":
-            return "Error" if find_key(data, "error") else "OK"
+class PoolDiagnosticSensor(ElectrochlorEntity, SensorEntity):
+    """Diagnostic sensor exposing coordinator internals on the device."""
 
-        if special == "cell_direction":
-            status = find_key(data, "status") or {}
-            if status.get("cellDirectionA"):
-                return "A"
-            elif status.get("cellDirectionB"):
-                return "B"
-            return "Off"
+    entity_description: ElectrochlorDiagnosticSensorEntityDescription
 
-        value = find_key(data, key)
+    # Timing summaries and counters change on nearly every refresh.
+    _unrecorded_attributes = frozenset(
+        {
+            "count",
+            "mean_ms",
+            "p50_ms",
+            "p95_ms",
+            "max_ms",
+            "last_ms",
+            "responses",
+            "total_bytes",
+            ERROR_CIRCUIT_OPEN,
+            ERROR_CONNECTION,
+            ERROR_HTTP_STATUS,
+            ERROR_INVALID_JSON,
+            ERROR_TIMEOUT,
+            "queue_depth",
+            "max_queue_depth",
+            "coalesced",
+            "failed",
+            "written",
+            "unchanged_refreshes",
+            "max_per_minute",
+            "seconds_waited",
+        }
+    )
 
-        if value is None:
-            _LOGGER.debug("Sensor %s (%s) is unavailable, data: %s", self.name, key, data)
-            return "unavailable"
+    def __init__(
+        self,
+        coordinator: ElectrochlorDataUpdateCoordinator,
+        entry: ConfigEntry,
+        description: ElectrochlorDiagnosticSensorEntityDescription,
+    ) -> None:
+        super().__init__(coordinator, entry)
+        self.entity_description = description
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+        self._attr_extra_state_attributes = None
 
-        # Round numeric values if requested
-        if "round" in self.config and isinstance(value, (int, float)):
-            value = round(value, self.config["round"])
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_DIAGNOSTICS.format(self._entry.entry_id),
+                self._handle_coordinator_update,
+            )
+        )
 
-        return value
+    def _update_from_snapshot(self) -> None:
+        description = self.entity_description
+        self._attr_native_value = description.value_fn(self.coordinator)
+        if description.attributes_fn is not None:
+            self._attr_extra_state_attributes = description.attributes_fn(self.coordinator)
 
     @property
-    def icon(self) -> str:
-        key = self.config["key"]
-        value = self.native_value
-        icons_for_key = ICONS.get(key, {})
-        if str(value).lower() in ["true", "on"]:
-            return icons_for_key.get("on", icons_for_key.get("default", "mdi:help-circle"))
-        if str(value).lower() in ["false", "off"]:
-            return icons_for_key.get("off", icons_for_key.get("default", "mdi:help-circle"))
-        if value in icons_for_key:
-            return icons_for_key[value]
-        return icons_for_key.get("default", "mdi:help-circle")
+    def available(self) -> bool:
+        # Diagnostics stay readable while the device itself is unreachable.
+        return True
+
+    @property
+    def is_stale(self) -> bool:
+        return False
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        return self._attr_extra_state_attributes
+
+    def _state_signature(self) -> tuple[Any, ...]:
+        return (self._attr_native_value, self._attr_extra_state_attributes)
+
+
+class PoolStatisticsSensor(ElectrochlorEntity, SensorEntity):
+    """Rolling statistic of a reading, updated as samples enter the window."""
+
+    entity_description: ElectrochlorStatisticsSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: ElectrochlorDataUpdateCoordinator,
+        entry: ConfigEntry,
+        description: ElectrochlorStatisticsSensorEntityDescription,
+    ) -> None:
+        super().__init__(coordinator, entry)
+        self.entity_description = description
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+        self._window = coordinator.statistics.window(description.source, description.hours)
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_STATISTICS.format(self._entry.entry_id),
+                self._handle_coordinator_update,
+            )
+        )
+
+    def _update_from_snapshot(self) -> None:
+        value = self.entity_description.value_fn(self._window)
+        if value is not None:
+            value = round(value, self.entity_description.digits)
+        self._attr_native_value = value
 
     @property
     def available(self) -> bool:
-        return self.coordinator.last_update_success
+        # Restored samples keep the statistic meaningful while the device is offline.
+        return self._attr_native_value is not None
 
-    async def async_update(self) -> None:
-        await self.coordinator.async_request_refresh()
+    @property
+    def is_stale(self) -> bool:
+        return False
+
+    def _state_signature(self) -> tuple[Any, ...]:
+        return (self._attr_native_value,)
+
+
+class PoolRuntimeSensor(ElectrochlorEntity, SensorEntity):
+    """Run-time counter fed by on/off edges rather than by every refresh."""
+
+    entity_description: ElectrochlorRuntimeSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: ElectrochlorDataUpdateCoordinator,
+        entry: ConfigEntry,
+        description: ElectrochlorRuntimeSensorEntityDescription,
+    ) -> None:
+        super().__init__(coordinator, entry)
+        self.entity_description = description
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+        self._counter = coordinator.runtime.counters[description.counter]
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_RUNTIME.format(self._entry.entry_id),
+                self._handle_coordinator_update,
+            )
+        )
+
+    def _update_from_snapshot(self) -> None:
+        lifetime, today = self._counter.totals(time())
+        seconds = today if self.entity_description.daily else lifetime
+        self._attr_native_value = round(seconds / 3600, 3)
 
     @property
-    def device_info(self):
-        api_data = self.coordinator.data if isinstance(self.coordinator.data, dict) else None
-        return make_device_info(self._entry, api_data)
+    def available(self) -> bool:
+        # Persisted totals remain valid while the device is offline.
+        return True
+
+    @property
+    def is_stale(self) -> bool:
+        return False
+
+    def _state_signature(self) -> tuple[Any, ...]:
+        return (self._attr_native_value,)
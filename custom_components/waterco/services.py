@@ -0,0 +1,221 @@
+"""Services for Waterco Electrochlor integration."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable
+from time import monotonic
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv, device_registry as dr
+
+from .const import DOMAIN, PUMP_SPEED_MAX, PUMP_SPEED_MIN
+from .coordinator import CONFIRM_TIMEOUT, ElectrochlorDataUpdateCoordinator
+from .profiler import async_profile
+from .snapshot import ElectrochlorSnapshot
+from .switch import extract_state
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_APPLY_SCENE = "apply_scene"
+SERVICE_PROFILE = "profile"
+
+ATTR_DEVICE_ID = "device_id"
+ATTR_PUMP = "pump"
+ATTR_PUMP_SPEED = "pump_speed"
+ATTR_LIGHT = "light"
+ATTR_LIGHT_COLOUR = "light_colour"
+ATTR_TIMEOUT = "timeout"
+ATTR_CYCLES = "cycles"
+ATTR_BLOCK_THRESHOLD = "block_threshold"
+
+DEFAULT_PROFILE_CYCLES = 5
+DEFAULT_BLOCK_THRESHOLD = 50  # milliseconds
+DEFAULT_PROFILE_TIMEOUT = 900  # seconds
+
+
+def _read_speed(snapshot: ElectrochlorSnapshot) -> int | None:
+    try:
+        return int(float(snapshot.get("pumpSpeed")))
+    except (TypeError, ValueError):
+        return None
+
+
+# Scene field -> (command path, reads the device's current value).
+SCENE_TARGETS: dict[str, tuple[str, Callable[[ElectrochlorSnapshot], Any]]] = {
+    ATTR_PUMP: ("state", lambda snapshot: extract_state(snapshot.status.get("pump"))),
+    ATTR_PUMP_SPEED: ("pumpSpeed", _read_speed),
+    ATTR_LIGHT: ("light", lambda snapshot: extract_state(snapshot.status.get("light"))),
+    ATTR_LIGHT_COLOUR: ("lightColor", lambda snapshot: snapshot.get("lightColor")),
+}
+
+APPLY_SCENE_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional(ATTR_DEVICE_ID): cv.string,
+            vol.Optional(ATTR_PUMP): cv.boolean,
+            vol.Optional(ATTR_PUMP_SPEED): vol.All(
+                vol.Coerce(int), vol.Range(min=PUMP_SPEED_MIN, max=PUMP_SPEED_MAX)
+            ),
+            vol.Optional(ATTR_LIGHT): cv.boolean,
+            vol.Optional(ATTR_LIGHT_COLOUR): cv.string,
+            vol.Optional(ATTR_TIMEOUT, default=CONFIRM_TIMEOUT): vol.All(
+                vol.Coerce(float), vol.Range(min=1, max=120)
+            ),
+        }
+    ),
+    cv.has_at_least_one_key(*SCENE_TARGETS),
+)
+
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_DEVICE_ID): cv.string,
+        vol.Optional(ATTR_CYCLES, default=DEFAULT_PROFILE_CYCLES): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=100)
+        ),
+        vol.Optional(ATTR_BLOCK_THRESHOLD, default=DEFAULT_BLOCK_THRESHOLD): vol.All(
+            vol.Coerce(float), vol.Range(min=5, max=10000)
+        ),
+        vol.Optional(ATTR_TIMEOUT, default=DEFAULT_PROFILE_TIMEOUT): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=86400)
+        ),
+    }
+)
+
+
+def _scene_order(targets: dict[str, Any]) -> list[str]:
+    """Order scene fields so each setting lands while its output is running.
+
+    Speed and colour follow their output being switched on, and precede it
+    being switched off, so the device never applies them to an idle output.
+    """
+    order: list[str] = []
+    for output, setting in ((ATTR_PUMP, ATTR_PUMP_SPEED), (ATTR_LIGHT, ATTR_LIGHT_COLOUR)):
+        pair = [output, setting] if targets.get(output, True) else [setting, output]
+        order.extend(field for field in pair if field in targets)
+    return order
+
+
+def _coordinator_for_call(
+    hass: HomeAssistant, device_id: str | None
+) -> ElectrochlorDataUpdateCoordinator:
+    coordinators: dict[str, ElectrochlorDataUpdateCoordinator] = hass.data.get(DOMAIN, {})
+    if device_id is None:
+        if len(coordinators) != 1:
+            raise ServiceValidationError(
+                "device_id is required when more than one controller is configured"
+            )
+        return next(iter(coordinators.values()))
+    device = dr.async_get(hass).async_get(device_id)
+    if device is not None:
+        for entry_id in device.config_entries:
+            if entry_id in coordinators:
+                return coordinators[entry_id]
+    raise ServiceValidationError(f"No loaded Electrochlor controller for device {device_id}")
+
+
+async def _async_apply_scene(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Send all scene commands back to back and confirm them with one burst.
+
+    Targets the live snapshot already shows at the requested value are not
+    sent, unless another command for them is still queued.
+    """
+    start = monotonic()
+    coordinator = _coordinator_for_call(hass, call.data.get(ATTR_DEVICE_ID))
+    targets = {field: call.data[field] for field in SCENE_TARGETS if field in call.data}
+
+    def _matches(snapshot: ElectrochlorSnapshot, field: str) -> bool:
+        return SCENE_TARGETS[field][1](snapshot) == targets[field]
+
+    current = coordinator.data
+    unchanged = {
+        field
+        for field in targets
+        if current is not None
+        and not current.stale
+        and not coordinator.commands.is_pending(SCENE_TARGETS[field][0])
+        and _matches(current, field)
+    }
+    order = _scene_order({field: value for field, value in targets.items() if field not in unchanged})
+
+    # Queue everything at once: the command queue sends in this order over
+    # the pooled connection without waiting for confirmations in between.
+    sent = await asyncio.gather(
+        *(
+            coordinator.commands.async_send(SCENE_TARGETS[field][0], targets[field])
+            for field in order
+        )
+    )
+    sent_ok = dict(zip(order, sent))
+
+    confirmed_all = False
+    waiting = [field for field in order if sent_ok[field]]
+    if waiting:
+        confirmed_all = await coordinator.async_wait_for(
+            lambda snapshot: all(_matches(snapshot, field) for field in waiting),
+            timeout=call.data[ATTR_TIMEOUT],
+        )
+
+    snapshot = coordinator.data
+    results = {
+        field: (
+            {"value": targets[field], "sent": False, "confirmed": True, "unchanged": True}
+            if field in unchanged
+            else {
+                "value": targets[field],
+                "sent": sent_ok[field],
+                "confirmed": sent_ok[field]
+                and (confirmed_all or (snapshot is not None and _matches(snapshot, field))),
+            }
+        )
+        for field in _scene_order(targets)
+    }
+    latency = round(monotonic() - start, 3)
+    success = all(result["confirmed"] for result in results.values())
+    if not success:
+        _LOGGER.warning(
+            "Scene on %s not fully applied after %ss: %s", coordinator.name, latency, results
+        )
+    return {"success": success, "latency": latency, "results": results}
+
+
+async def _async_profile(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Profile the next refresh cycles of one controller."""
+    coordinator = _coordinator_for_call(hass, call.data.get(ATTR_DEVICE_ID))
+    return await async_profile(
+        hass,
+        coordinator,
+        cycles=call.data[ATTR_CYCLES],
+        threshold=call.data[ATTR_BLOCK_THRESHOLD] / 1000,
+        timeout=call.data[ATTR_TIMEOUT],
+    )
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration's services."""
+
+    async def _async_handle_apply_scene(call: ServiceCall) -> ServiceResponse:
+        return await _async_apply_scene(hass, call)
+
+    async def _async_handle_profile(call: ServiceCall) -> ServiceResponse:
+        return await _async_profile(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_APPLY_SCENE,
+        _async_handle_apply_scene,
+        schema=APPLY_SCENE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE,
+        _async_handle_profile,
+        schema=PROFILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -0,0 +1,68 @@
+"""Normalized device snapshot for Waterco Electrochlor integration."""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+
+def _build_index(data: dict[str, Any], index: dict[str, Any]) -> None:
+    """Flatten a nested payload into key -> value.
+
+    Resolution matches the old recursive ``find_key`` lookup: a key present
+    on a dict wins over the same key further down, and among nested dicts
+    the first non-None match in payload order wins.
+    """
+    nested: dict[str, Any] = {}
+    for value in data.values():
+        if isinstance(value, dict):
+            child: dict[str, Any] = {}
+            _build_index(value, child)
+            for child_key, child_value in child.items():
+                if child_value is not None and child_key not in nested:
+                    nested[child_key] = child_value
+    nested.update(data)
+    index.update(nested)
+
+
+@dataclass(frozen=True, slots=True)
+class ElectrochlorSnapshot:
+    """One parsed status payload, shared read-only by all entities."""
+
+    raw: dict[str, Any]
+    result: dict[str, Any] = field(compare=False)
+    status: dict[str, Any] = field(compare=False)
+    model: str | None = field(compare=False)
+    version: str | None = field(compare=False)
+    values: dict[str, Any] = field(compare=False, repr=False)
+    # True for a snapshot restored from disk rather than fetched live.
+    stale: bool = False
+
+    @classmethod
+    def from_payload(cls, data: dict[str, Any], stale: bool = False) -> ElectrochlorSnapshot:
+        """Build a snapshot from the device's JSON object."""
+        values: dict[str, Any] = {}
+        _build_index(data, values)
+
+        result = data.get("result")
+        if not isinstance(result, dict):
+            result = {}
+        # The flags live in result.status; the flattened index is only for
+        # single-value lookups, where any nested "status" key could win.
+        status = result.get("status")
+        if not isinstance(status, dict):
+            status = {}
+
+        return cls(
+            raw=data,
+            result=result,
+            status=status,
+            model=result.get("model", data.get("model")),
+            version=result.get("version", data.get("version")),
+            values=values,
+            stale=stale,
+        )
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the value for a key anywhere in the payload."""
+        value = self.values.get(key)
+        return default if value is None else value
@@ -0,0 +1,306 @@
+"""Rolling statistics over recent Electrochlor readings."""
+from __future__ import annotations
+
+import math
+from array import array
+from collections import deque
+from collections.abc import Iterable
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import CONF_STATISTICS_WINDOWS, DEFAULT_STATISTICS_WINDOWS, DOMAIN
+from .snapshot import ElectrochlorSnapshot
+
+# Readings tracked per controller.
+STAT_KEYS = ("ph", "temp", "chlorineProduction")
+# Samples kept per window; the window length sets the spacing between them
+# (10 s for 1 hour, 4 min for 24 hours). Readings in between only widen the
+# latest sample's low and high, so min and max still see short excursions.
+WINDOW_SAMPLES = 360
+
+STORAGE_VERSION = 1
+# Minimum gap between writes so frequent samples do not keep postponing the save.
+SAVE_INTERVAL = 300  # seconds
+
+
+class RollingWindow:
+    """Fixed-capacity ring buffer of (time, value, low, high) samples over a duration.
+
+    A sample's value is the first reading in its spacing interval and its
+    low and high cover every reading in it. Running sums of the values give
+    the mean and standard deviation, and monotonic queues of buffer
+    positions over the lows and highs give the min and max, so adding or
+    expiring a reading is O(1) amortised and reading any statistic is O(1).
+    """
+
+    __slots__ = (
+        "duration",
+        "capacity",
+        "spacing",
+        "_times",
+        "_values",
+        "_lows",
+        "_highs",
+        "_start",
+        "_end",
+        "_sum",
+        "_sumsq",
+        "_min",
+        "_max",
+    )
+
+    def __init__(self, duration: float, capacity: int = WINDOW_SAMPLES) -> None:
+        self.duration = duration
+        self.capacity = capacity
+        self.spacing = duration / capacity
+        self._times = array("d", [0.0]) * capacity
+        self._values = array("d", [0.0]) * capacity
+        self._lows = array("d", [0.0]) * capacity
+        self._highs = array("d", [0.0]) * capacity
+        # Absolute sequence numbers of the oldest sample and the next free one.
+        self._start = 0
+        self._end = 0
+        self._sum = 0.0
+        self._sumsq = 0.0
+        self._min: deque[int] = deque()
+        self._max: deque[int] = deque()
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def _time(self, seq: int) -> float:
+        return self._times[seq % self.capacity]
+
+    def _value(self, seq: int) -> float:
+        return self._values[seq % self.capacity]
+
+    def _low(self, seq: int) -> float:
+        return self._lows[seq % self.capacity]
+
+    def _high(self, seq: int) -> float:
+        return self._highs[seq % self.capacity]
+
+    def add(self, when: float, value: float) -> bool:
+        """Expire old samples and record a reading.
+
+        A reading within the spacing of the latest sample only widens that
+        sample's low and high. Returns True if the window's contents changed.
+        """
+        changed = self.expire(when)
+        if self._end > self._start and when - self._time(self._end - 1) < self.spacing:
+            return self._widen(value) or changed
+        self._append(when, value, value, value)
+        return True
+
+    def _append(self, when: float, value: float, low: float, high: float) -> None:
+        if len(self) == self.capacity:
+            self._pop()
+        slot = self._end % self.capacity
+        self._times[slot] = when
+        self._values[slot] = value
+        self._lows[slot] = low
+        self._highs[slot] = high
+        self._sum += value
+        self._sumsq += value * value
+        self._end += 1
+        self._push_extremes()
+
+    def _widen(self, value: float) -> bool:
+        """Fold a reading into the latest sample's low and high."""
+        slot = (self._end - 1) % self.capacity
+        if self._lows[slot] <= value <= self._highs[slot]:
+            return False
+        self._lows[slot] = min(self._lows[slot], value)
+        self._highs[slot] = max(self._highs[slot], value)
+        # The latest sample always ends both queues; requeue it with its new extremes.
+        self._min.pop()
+        self._max.pop()
+        self._push_extremes()
+        return True
+
+    def _push_extremes(self) -> None:
+        latest = self._end - 1
+        low, high = self._low(latest), self._high(latest)
+        while self._min and self._low(self._min[-1]) >= low:
+            self._min.pop()
+        self._min.append(latest)
+        while self._max and self._high(self._max[-1]) <= high:
+            self._max.pop()
+        self._max.append(latest)
+
+    def expire(self, now: float) -> bool:
+        """Drop samples older than the window; return True if any were dropped."""
+        cutoff = now - self.duration
+        dropped = False
+        while self._end > self._start and self._time(self._start) <= cutoff:
+            self._pop()
+            dropped = True
+        return dropped
+
+    def _pop(self) -> None:
+        value = self._value(self._start)
+        self._sum -= value
+        self._sumsq -= value * value
+        if self._min and self._min[0] == self._start:
+            self._min.popleft()
+        if self._max and self._max[0] == self._start:
+            self._max.popleft()
+        self._start += 1
+        # Re-add the sums once per lap of the buffer so float error cannot build up.
+        if self._start % self.capacity == 0:
+            self._sum = math.fsum(self._value(seq) for seq in range(self._start, self._end))
+            self._sumsq = math.fsum(
+                self._value(seq) ** 2 for seq in range(self._start, self._end)
+            )
+
+    @property
+    def minimum(self) -> float | None:
+        return self._low(self._min[0]) if self._min else None
+
+    @property
+    def maximum(self) -> float | None:
+        return self._high(self._max[0]) if self._max else None
+
+    @property
+    def mean(self) -> float | None:
+        count = len(self)
+        return self._sum / count if count else None
+
+    @property
+    def stddev(self) -> float | None:
+        """Population standard deviation of the samples in the window."""
+        count = len(self)
+        if not count:
+            return None
+        mean = self._sum / count
+        return math.sqrt(max(0.0, self._sumsq / count - mean * mean))
+
+    @property
+    def rate(self) -> float | None:
+        """Change per hour between the oldest and newest sample."""
+        if len(self) < 2:
+            return None
+        first, last = self._start, self._end - 1
+        elapsed = self._time(last) - self._time(first)
+        if elapsed <= 0:
+            return None
+        return (self._value(last) - self._value(first)) / elapsed * 3600
+
+    def samples(self) -> Iterable[tuple[float, float]]:
+        for seq in range(self._start, self._end):
+            yield self._time(seq), self._value(seq)
+
+    def as_stored(self) -> dict[str, Any]:
+        """Return the samples as a base time plus whole-second offsets."""
+        samples = list(self.samples())
+        base = samples[0][0] if samples else 0.0
+        sequence = range(self._start, self._end)
+        return {
+            "t0": base,
+            "dt": [round(when - base) for when, _ in samples],
+            "v": [value for _, value in samples],
+            "lo": [self._low(seq) for seq in sequence],
+            "hi": [self._high(seq) for seq in sequence],
+        }
+
+    def load(self, stored: dict[str, Any], now: float) -> None:
+        base = float(stored.get("t0", 0.0))
+        values = [float(value) for value in stored.get("v", ())]
+        # Samples saved before lows and highs were kept span a single reading.
+        lows = stored.get("lo") or values
+        highs = stored.get("hi") or values
+        for offset, value, low, high in zip(stored.get("dt", ()), values, lows, highs):
+            when = base + offset
+            if self._end > self._start and when - self._time(self._end - 1) < self.spacing:
+                continue
+            self._append(when, value, float(low), float(high))
+        self.expire(now)
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "samples": len(self),
+            "min": self.minimum,
+            "max": self.maximum,
+            "mean": self.mean,
+            "stddev": self.stddev,
+            "rate_per_hour": self.rate,
+        }
+
+
+def statistics_windows(entry: ConfigEntry) -> tuple[int, ...]:
+    """Return the configured statistics windows in hours, shortest first."""
+    windows = entry.options.get(CONF_STATISTICS_WINDOWS, DEFAULT_STATISTICS_WINDOWS)
+    return tuple(sorted({int(hours) for hours in windows}))
+
+
+def _statistics_store(hass: HomeAssistant, entry: ConfigEntry) -> Store[dict[str, Any]]:
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.statistics")
+
+
+async def async_remove_stored_statistics(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the statistics samples persisted for an entry."""
+    await _statistics_store(hass, entry).async_remove()
+
+
+def _window_id(key: str, hours: int) -> str:
+    return f"{key}:{hours}"
+
+
+class PoolStatistics:
+    """Rolling windows for one controller's readings, persisted across restarts."""
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        self.hass = hass
+        self.hours = statistics_windows(entry)
+        self.windows: dict[str, RollingWindow] = {
+            _window_id(key, hours): RollingWindow(hours * 3600)
+            for key in STAT_KEYS
+            for hours in self.hours
+        }
+        self._store = _statistics_store(hass, entry)
+        self._next_save = 0.0
+
+    def window(self, key: str, hours: int) -> RollingWindow:
+        return self.windows[_window_id(key, hours)]
+
+    async def async_load(self, now: float) -> None:
+        stored = await self._store.async_load()
+        if not stored:
+            return
+        for window_id, samples in stored.get("windows", {}).items():
+            if window_id in self.windows:
+                self.windows[window_id].load(samples, now)
+
+    @callback
+    def add(self, snapshot: ElectrochlorSnapshot, now: float) -> bool:
+        """Feed a live snapshot into every window; return True if any changed."""
+        changed = False
+        for window_id, window in self.windows.items():
+            value = snapshot.get(window_id.partition(":")[0])
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                changed |= window.add(now, float(value))
+            else:
+                changed |= window.expire(now)
+        if changed:
+            loop_time = self.hass.loop.time()
+            if loop_time >= self._next_save:
+                self._next_save = loop_time + SAVE_INTERVAL
+                self._store.async_delay_save(self._data_to_store, SAVE_INTERVAL)
+        return changed
+
+    @callback
+    def _data_to_store(self) -> dict[str, Any]:
+        return {
+            "windows": {
+                window_id: window.as_stored() for window_id, window in self.windows.items()
+            }
+        }
+
+    async def async_save(self) -> None:
+        await self._store.async_save(self._data_to_store())
+
+    def as_dict(self) -> dict[str, Any]:
+        return {window_id: window.summary() for window_id, window in self.windows.items()}
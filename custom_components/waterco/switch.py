@@ -1,35 +1,33 @@
 """Switch platform for Waterco Electrochlor integration."""
+from __future__ import annotations
+
 import logging
-import aiohttp
-import asyncio
-import random
+from dataclasses import dataclass
 from typing import Any
 
-from homeassistant.components.switch import SwitchEntity
+from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
 from .const import DOMAIN
-from .device_info import make_device_info
-from .device_icons import ICONS
+from .device_icons import icon_table
+from .entity import (
+    ElectrochlorCommandDescriptionMixin,
+    ElectrochlorEntity,
+    async_add_supported_entities,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
-SWITCH_CONFIG = [
-    {"key": "pump", "name": "Pool Pump", "command_key": "state", "status_key": "status"},
-    {"key": "light", "name": "Pool Lights", "command_key": "light", "status_key": "status"},
-]
-
-POLL_INTERVAL = 3
-POLL_TIMEOUT = 30
-
-def find_key(data: dict[str, Any], target_key: str) -> Any:
-    """Recursively search for a key in nested dictionaries."""
-    if isinstance(data, dict):
-        if target_key in data:
-            return data[target_key]
-        for value in data.values():
-            found = find_key(value, target_key)
-            if found is not None:
-                return found
-    return None
+
+@dataclass(frozen=True, kw_only=True)
+class ElectrochlorSwitchEntityDescription(
+    SwitchEntityDescription, ElectrochlorCommandDescriptionMixin
+):
+    """Describes a controllable Electrochlor output."""
+
+
+SWITCH_DESCRIPTIONS: tuple[ElectrochlorSwitchEntityDescription, ...] = (
+    ElectrochlorSwitchEntityDescription(key="pump", name="Pool Pump", command_key="state"),
+    ElectrochlorSwitchEntityDescription(key="light", name="Pool Lights", command_key="light"),
+)
 
 def extract_state(value: Any) -> bool:
     """Convert different types of values to boolean."""
@@ -43,112 +41,73 @@ def extract_state(value: Any) -> bool:
 
 async def async_setup_entry(hass, entry, async_add_entities):
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    switches = [GenericPoolSwitch(coordinator, entry, config) for config in SWITCH_CONFIG]
-    async_add_entities(switches)
-
-class BaseSwitch(SwitchEntity):
-    """Base switch class."""
-
-    def __init__(self, coordinator, entry):
-        self.coordinator = coordinator
-        self.entry = entry
-
-    @property
-    def available(self):
-        # Available if coordinator has any data
-        return bool(self.coordinator.data)
-
-    @property
-    def device_info(self):
-        return make_device_info(self.entry, self.coordinator.data)
-
-    async def _send_command(self, path: str, value: Any):
-        boundary = "----WebKitFormBoundary" + "".join(
-            random.choices("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789", k=16)
-        )
-        url = f"http://{self.coordinator.ip_address}:{self.coordinator.port}/electrochlor/{path}"
-        data = (
-            f"--{boundary}\r\n"
-            f'Content-Disposition: form-data; name="value"\r\n\r\n'
-            f"{str(value).lower()}\r\n"
-            f"--{boundary}--\r\n"
-        )
-        headers = {"Content-Type": f"multipart/form-data; boundary={boundary}"}
-
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, data=data.encode("utf-8"), headers=headers) as resp:
-                    text = await resp.text()
-                    if resp.status != 200:
-                        _LOGGER.error(
-                            "Failed command to %s (HTTP %s): %s", path, resp.status, text.strip()
-                        )
-        except Exception as e:
-            _LOGGER.error("Error sending command to %s: %s", path, e)
-
-    async def _poll_until_state(self, key: str, desired_state: bool, status_key: str | None = None) -> bool:
-        """Poll the device until the desired state is reached or timeout occurs."""
-        elapsed = 0
-        while elapsed < POLL_TIMEOUT:
-            await self.coordinator.async_request_refresh()
-            data = self.coordinator.data or {}
-            if status_key:
-                data = data.get(status_key, {})
-            value = find_key(data, key)
-            if extract_state(value) == desired_state:
-                return True
-            await asyncio.sleep(POLL_INTERVAL)
-            elapsed += POLL_INTERVAL
-        _LOGGER.warning("Polling timeout for %s; state may not match desired state.", key)
-        return False
-
-class GenericPoolSwitch(BaseSwitch):
+    async_add_supported_entities(
+        coordinator,
+        entry,
+        async_add_entities,
+        SWITCH_DESCRIPTIONS,
+        lambda description: GenericPoolSwitch(coordinator, entry, description),
+    )
+
+class GenericPoolSwitch(ElectrochlorEntity, SwitchEntity):
     """Switch for pool components with dynamic icons and optimistic updates."""
 
-    def __init__(self, coordinator, entry, config):
+    entity_description: ElectrochlorSwitchEntityDescription
+
+    def __init__(self, coordinator, entry, description: ElectrochlorSwitchEntityDescription):
         super().__init__(coordinator, entry)
-        self.config = config
+        self.entity_description = description
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+        self._icons = icon_table(description.key)
         self._optimistic_state: bool | None = None
+        self._command_seq = 0
 
-    @property
-    def name(self):
-        return self.config["name"]
+    def _read_state(self, snapshot) -> bool:
+        if snapshot is None:
+            return False
+        return extract_state(snapshot.status.get(self.entity_description.key))
 
-    @property
-    def unique_id(self):
-        return f"{self.entry.entry_id}_{self.config['key']}"
+    async def _wait_for_state(self, desired_state: bool) -> bool:
+        """Wait for the coordinator's burst polling to confirm the desired state."""
+        confirmed = await self.coordinator.async_wait_for(
+            lambda snapshot: self._read_state(snapshot) == desired_state
+        )
+        if not confirmed:
+            _LOGGER.warning("Polling timeout for %s; state may not match desired state.", self.name)
+        return confirmed
 
-    @property
-    def is_on(self):
+    def _update_from_snapshot(self) -> None:
+        """Resolve the on/off state and icon, preferring a pending optimistic state."""
         if self._optimistic_state is not None:
-            return self._optimistic_state
-        data = self.coordinator.data or {}
-        value = find_key(data, self.config["key"])
-        return extract_state(value)
-
-    @property
-    def icon(self):
-        key = self.config["key"]
-        state = self.is_on
-        icons_for_key = ICONS.get(key, {})
-        if state and "on" in icons_for_key:
-            return icons_for_key["on"]
-        if not state and "off" in icons_for_key:
-            return icons_for_key["off"]
-        return icons_for_key.get("default", "mdi:help-circle")
+            is_on = self._optimistic_state
+        else:
+            is_on = self._read_state(self.coordinator.data)
+        self._attr_is_on = is_on
+        self._attr_icon = self._icons.for_state(is_on)
+
+    def _state_signature(self) -> tuple[Any, ...]:
+        return (self._attr_is_on, self._attr_icon)
 
     async def async_turn_on(self, **kwargs):
-        self._optimistic_state = True
-        self.async_write_ha_state()
-        await self._send_command(self.config.get("command_key", self.config["key"]), True)
-        await self._poll_until_state(self.config["key"], True, status_key=self.config.get("status_key"))
-        self._optimistic_state = None
-        self.async_write_ha_state()
+        await self._async_set_state(True)
 
     async def async_turn_off(self, **kwargs):
-        self._optimistic_state = False
-        self.async_write_ha_state()
-        await self._send_command(self.config.get("command_key", self.config["key"]), False)
-        await self._poll_until_state(self.config["key"], False, status_key=self.config.get("status_key"))
-        self._optimistic_state = None
+        await self._async_set_state(False)
+
+    def _set_optimistic(self, state: bool | None) -> None:
+        self._optimistic_state = state
+        self._update_from_snapshot()
         self.async_write_ha_state()
+
+    async def _async_set_state(self, desired_state: bool) -> None:
+        self._command_seq += 1
+        seq = self._command_seq
+        self._set_optimistic(desired_state)
+        description = self.entity_description
+        try:
+            if await self.coordinator.commands.async_send(description.command_path, desired_state):
+                await self._wait_for_state(desired_state)
+        finally:
+            # A newer command owns the optimistic state until it completes.
+            if seq == self._command_seq:
+                self._set_optimistic(None)
@@ -0,0 +1,245 @@
+"""Recording and replay of raw controller traffic for Waterco Electrochlor integration."""
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import logging
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timedelta
+from pathlib import Path
+from time import monotonic, time
+from typing import Any
+
+import aiohttp
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import API_PATH, DOMAIN
+from .metrics import ERROR_CONNECTION, ERROR_HTTP_STATUS, ERROR_TIMEOUT, PipelineMetrics
+
+_LOGGER = logging.getLogger(__name__)
+
+KIND_STATUS = "status"
+KIND_ERROR = "error"
+KIND_COMMAND = "command"
+
+# The live log is rotated to .1, .2, ... once it grows past MAX_LOG_BYTES.
+MAX_LOG_BYTES = 2 * 1024 * 1024
+LOG_BACKUPS = 5
+# Records are buffered in memory and appended as one gzip member per flush.
+FLUSH_INTERVAL = timedelta(seconds=30)
+MAX_BUFFERED = 500
+
+
+def traffic_log_path(hass: HomeAssistant, entry: ConfigEntry) -> str:
+    """Return where an entry's traffic log is written."""
+    return hass.config.path(DOMAIN, f"traffic-{entry.entry_id}.jsonl.gz")
+
+
+def traffic_files(path: str | Path) -> list[Path]:
+    """Return a log and its rotated backups, oldest first."""
+    path = Path(path)
+    files = [path.with_name(f"{path.name}.{index}") for index in range(LOG_BACKUPS, 0, -1)]
+    files.append(path)
+    return [file for file in files if file.exists()]
+
+
+def read_traffic(paths: Iterable[str | Path]) -> Iterator[dict[str, Any]]:
+    """Yield recorded exchanges from log files in order.
+
+    Status records that repeat the previous body are stored without it;
+    the body is filled back in here. A repeat whose original was rotated
+    away is skipped.
+    """
+    body: str | None = None
+    for path in paths:
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            for line in file:
+                record = json.loads(line)
+                if record["k"] == KIND_STATUS:
+                    if record["body"] is None:
+                        if body is None:
+                            continue
+                        record["body"] = body
+                    body = record["body"]
+                yield record
+
+
+def _error_record(err: BaseException) -> dict[str, Any] | None:
+    if isinstance(err, asyncio.TimeoutError):
+        return {"k": KIND_ERROR, "error": ERROR_TIMEOUT}
+    if isinstance(err, aiohttp.ClientResponseError):
+        return {"k": KIND_ERROR, "error": ERROR_HTTP_STATUS, "status": err.status}
+    if isinstance(err, aiohttp.ClientError):
+        return {"k": KIND_ERROR, "error": ERROR_CONNECTION}
+    return None
+
+
+class TrafficRecorder:
+    """Append raw status responses and commands to a compressed, rotated log.
+
+    Each line is one JSON record with a wall-clock timestamp. Bodies are
+    kept byte for byte; writes happen in the executor in batches.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        path: str,
+        max_bytes: int = MAX_LOG_BYTES,
+        backups: int = LOG_BACKUPS,
+    ) -> None:
+        self.hass = hass
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.records = 0
+        self.rotations = 0
+        self._lines: list[str] = []
+        self._last_body: bytes | None = None
+        self._lock = asyncio.Lock()
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_start(self) -> None:
+        self._unsub = async_track_time_interval(self.hass, self._async_flush_interval, FLUSH_INTERVAL)
+
+    async def _async_flush_interval(self, _now: datetime) -> None:
+        await self.async_flush()
+
+    @callback
+    def _append(self, record: dict[str, Any]) -> None:
+        self._lines.append(json.dumps({"t": round(time(), 3), **record}, separators=(",", ":")))
+        self.records += 1
+        if len(self._lines) == MAX_BUFFERED:
+            self.hass.async_create_task(self.async_flush())
+
+    @callback
+    def record_status(self, body: bytes) -> None:
+        """Record a status response; an unchanged body is stored as null."""
+        text = None if body == self._last_body else body.decode("utf-8", "surrogateescape")
+        self._last_body = body
+        self._append({"k": KIND_STATUS, "body": text})
+
+    @callback
+    def record_error(self, err: BaseException) -> None:
+        """Record a failed status request, if it failed on the wire."""
+        if (record := _error_record(err)) is not None:
+            self._append(record)
+
+    @callback
+    def record_command(self, path: str, text: str, ok: bool) -> None:
+        self._append({"k": KIND_COMMAND, "path": path, "value": text, "ok": ok})
+
+    async def async_flush(self) -> None:
+        """Write buffered records out."""
+        if not self._lines:
+            return
+        lines, self._lines = self._lines, []
+        async with self._lock:
+            await self.hass.async_add_executor_job(self._write, "\n".join(lines) + "\n")
+
+    def _write(self, text: str) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with gzip.open(self.path, "at", encoding="utf-8") as file:
+            file.write(text)
+        if self.path.stat().st_size >= self.max_bytes:
+            self._rotate()
+
+    def _rotate(self) -> None:
+        name = self.path.name
+        if self.backups:
+            for index in range(self.backups - 1, 0, -1):
+                older = self.path.with_name(f"{name}.{index}")
+                if older.exists():
+                    older.replace(self.path.with_name(f"{name}.{index + 1}"))
+            self.path.replace(self.path.with_name(f"{name}.1"))
+        else:
+            self.path.unlink()
+        self.rotations += 1
+        _LOGGER.debug("Rotated traffic log %s", self.path)
+
+    async def async_stop(self) -> None:
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+        await self.async_flush()
+
+    def as_dict(self) -> dict[str, Any]:
+        return {"records": self.records, "rotations": self.rotations, "buffered": len(self._lines)}
+
+
+def _replay_error(record: dict[str, Any], url: URL) -> Exception:
+    error = record.get("error")
+    if error == ERROR_TIMEOUT:
+        return asyncio.TimeoutError()
+    if error == ERROR_HTTP_STATUS:
+        info = aiohttp.RequestInfo(url, "GET", CIMultiDictProxy(CIMultiDict()), url)
+        return aiohttp.ClientResponseError(info, (), status=record.get("status", 500))
+    return aiohttp.ClientConnectionError(f"Recorded {error} error")
+
+
+class ReplayTransport:
+    """Stand-in for ElectrochlorTransport that serves a recorded log.
+
+    Each status request returns (or fails like) the next recorded one. With
+    speed 0 records are served as fast as they are asked for; otherwise
+    requests are held back to the recorded timing divided by speed.
+    Commands are accepted and kept in commands without being replayed.
+    """
+
+    def __init__(
+        self,
+        records: Iterable[dict[str, Any]],
+        metrics: PipelineMetrics | None = None,
+        speed: float = 0.0,
+    ) -> None:
+        self.records = [record for record in records if record["k"] != KIND_COMMAND]
+        self.metrics = metrics
+        self.speed = speed
+        self.position = 0
+        self.commands: list[tuple[str, Any]] = []
+        self.recorder: TrafficRecorder | None = None
+        self._origin: tuple[float, float] | None = None
+        self.update_host("replay", 0)
+
+    def update_host(self, host: str, port: int) -> None:
+        self.host = host
+        self.port = port
+        self.base_url = f"http://{host}:{port}{API_PATH}"
+
+    @property
+    def done(self) -> bool:
+        return self.position >= len(self.records)
+
+    async def async_get_status(self) -> bytes:
+        if self.done:
+            raise aiohttp.ClientConnectionError("Replay finished")
+        record = self.records[self.position]
+        self.position += 1
+        if self.speed:
+            if self._origin is None:
+                self._origin = (monotonic(), record["t"])
+            else:
+                start, recorded = self._origin
+                delay = (record["t"] - recorded) / self.speed - (monotonic() - start)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+        if record["k"] == KIND_ERROR:
+            raise _replay_error(record, URL(self.base_url))
+        body: bytes = record["body"].encode("utf-8", "surrogateescape")
+        if self.metrics is not None:
+            self.metrics.record_payload(len(body))
+        return body
+
+    async def async_send_command(self, path: str, value: Any) -> bool:
+        self.commands.append((path, value))
+        return True
+
+    async def async_close(self) -> None:
+        """Nothing to close."""
@@ -0,0 +1,212 @@
+"""HTTP transport for a single Waterco Electrochlor controller."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from time import monotonic
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, TypeVar
+
+import aiohttp
+import async_timeout
+
+from homeassistant.core import HomeAssistant
+
+from .breaker import CircuitBreaker, CircuitOpenError
+from .const import API_PATH
+from .metrics import PHASE_CONNECT, PHASE_RESPONSE, PipelineMetrics
+
+if TYPE_CHECKING:
+    from .traffic import TrafficRecorder
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+REQUEST_TIMEOUT = 10  # seconds
+# The controller's embedded web server only copes with a couple of sockets.
+MAX_CONNECTIONS = 2
+KEEPALIVE_TIMEOUT = 30  # seconds
+BOUNDARY = "----ElectrochlorFormBoundary7MA4YWxkTrZu0gW"
+COMMAND_HEADERS = {"Content-Type": f"multipart/form-data; boundary={BOUNDARY}"}
+
+
+def _command_text(value: Any) -> str:
+    """Return the wire form of a value: lowercase booleans, anything else as is."""
+    if isinstance(value, bool):
+        return str(value).lower()
+    return str(value)
+
+
+def _encode_command(text: str) -> bytes:
+    """Encode a command value as the single-field multipart form the device expects."""
+    return (
+        f"--{BOUNDARY}\r\n"
+        f'Content-Disposition: form-data; name="value"\r\n\r\n'
+        f"{text}\r\n"
+        f"--{BOUNDARY}--\r\n"
+    ).encode("utf-8")
+
+
+async def _on_connection_create_start(
+    session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+) -> None:
+    context.connect_start = monotonic()
+
+
+async def _on_connection_create_end(
+    session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+) -> None:
+    if context.trace_request_ctx is not None:
+        context.trace_request_ctx[PHASE_CONNECT] = monotonic() - context.connect_start
+
+
+def _timing_trace_config() -> aiohttp.TraceConfig:
+    """Trace new TCP connections so connect time can be split from the response."""
+    trace = aiohttp.TraceConfig()
+    trace.on_connection_create_start.append(_on_connection_create_start)
+    trace.on_connection_create_end.append(_on_connection_create_end)
+    return trace
+
+
+class ElectrochlorTransport:
+    """Pooled keep-alive connection to one controller, shared by reads and commands."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        host: str,
+        port: int,
+        breaker: CircuitBreaker,
+        limiter: asyncio.Semaphore,
+        metrics: PipelineMetrics,
+    ) -> None:
+        self.hass = hass
+        self.breaker = breaker
+        self.limiter = limiter
+        self.metrics = metrics
+        # Set to log every exchange with the controller.
+        self.recorder: TrafficRecorder | None = None
+        self._session: aiohttp.ClientSession | None = None
+        self._bodies: dict[str, bytes] = {}
+        self.update_host(host, port)
+
+    def update_host(self, host: str, port: int) -> None:
+        """Point the transport at a (possibly new) host and port."""
+        self.host = host
+        self.port = port
+        self.base_url = f"http://{host}:{port}{API_PATH}"
+        self._command_urls: dict[str, str] = {}
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=MAX_CONNECTIONS,
+                limit_per_host=MAX_CONNECTIONS,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT),
+                trace_configs=[_timing_trace_config()],
+            )
+        return self._session
+
+    def _command_url(self, path: str) -> str:
+        url = self._command_urls.get(path)
+        if url is None:
+            url = self._command_urls[path] = f"{self.base_url}/{path}"
+        return url
+
+    def _command_body(self, value: Any) -> bytes:
+        text = _command_text(value)
+        body = self._bodies.get(text)
+        if body is None:
+            body = self._bodies[text] = _encode_command(text)
+        return body
+
+    async def _async_guarded(self, request: Callable[[], Awaitable[_T]]) -> _T:
+        """Run a request through the circuit breaker with the request timeout.
+
+        Raises CircuitOpenError without touching the network while the
+        breaker is open. The shared limiter caps requests in flight across
+        all controllers; time spent waiting for it is not part of the timeout.
+        """
+        self.breaker.check()
+        try:
+            async with self.limiter, async_timeout.timeout(REQUEST_TIMEOUT):
+                result = await request()
+        except (asyncio.TimeoutError, aiohttp.ClientError):
+            self.breaker.record_failure()
+            raise
+        except BaseException:
+            self.breaker.release()
+            raise
+        self.breaker.record_success()
+        return result
+
+    async def async_get_status(self) -> bytes:
+        """Fetch the raw status document, recording phase timings."""
+        timings: dict[str, float] = {}
+
+        async def _get() -> bytes:
+            timings["start"] = monotonic()
+            async with self._get_session().get(self.base_url, trace_request_ctx=timings) as resp:
+                resp.raise_for_status()
+                return await resp.read()
+
+        try:
+            body = await self._async_guarded(_get)
+        except CircuitOpenError:
+            raise
+        except BaseException as err:
+            if self.recorder is not None:
+                self.recorder.record_error(err)
+            raise
+        received = monotonic()
+        connect = timings.get(PHASE_CONNECT, 0.0)
+        self.metrics.record_phase(PHASE_CONNECT, connect)
+        self.metrics.record_phase(PHASE_RESPONSE, received - timings["start"] - connect)
+        self.metrics.record_payload(len(body))
+        if self.recorder is not None:
+            self.recorder.record_status(body)
+        return body
+
+    async def async_send_command(self, path: str, value: Any) -> bool:
+        """POST a command value to the controller, returning True on success."""
+        ok = await self._async_send_command(path, value)
+        if self.recorder is not None:
+            self.recorder.record_command(path, _command_text(value), ok)
+        return ok
+
+    async def _async_send_command(self, path: str, value: Any) -> bool:
+
+        async def _post() -> tuple[int, str]:
+            async with self._get_session().post(
+                self._command_url(path),
+                data=self._command_body(value),
+                headers=COMMAND_HEADERS,
+            ) as resp:
+                return resp.status, await resp.text()
+
+        start = monotonic()
+        try:
+            status, text = await self._async_guarded(_post)
+        except CircuitOpenError:
+            _LOGGER.error("Not sending command to %s: device is unreachable", path)
+            return False
+        except Exception as e:
+            _LOGGER.error("Error sending command to %s: %s", path, e)
+            return False
+        self.metrics.command_rtt.record(monotonic() - start)
+        if status != 200:
+            _LOGGER.error("Failed command to %s (HTTP %s): %s", path, status, text.strip())
+            return False
+        return True
+
+    async def async_close(self) -> None:
+        """Close pooled connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
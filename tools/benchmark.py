@@ -0,0 +1,203 @@
+"""End-to-end load benchmark for the Waterco Electrochlor integration.
+
+Starts N simulated controllers in a child process, sets up one config
+entry per controller in a test Home Assistant instance and lets the
+coordinators and all platforms run for a while. Reports refresh latency
+percentiles, loop CPU time per refresh, state writes per minute and
+command confirmation latency.
+
+Needs the Home Assistant test harness::
+
+    pip install pytest-homeassistant-custom-component
+    python tools/benchmark.py --controllers 1 10 100 --duration 60
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import multiprocessing
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from simulator import (  # noqa: E402
+    ElectrochlorSimulator,
+    SimulatorConfig,
+    add_config_arguments,
+    async_start,
+    config_from_args,
+)
+from harness import StateWriteCounter  # noqa: E402
+
+
+def _serve_simulators(count: int, config: SimulatorConfig, ports: Any, stop: Any) -> None:
+    async def _run() -> None:
+        runners = []
+        for _ in range(count):
+            runner, port = await async_start(ElectrochlorSimulator(config))
+            runners.append(runner)
+            ports.put(port)
+        while not stop.is_set():
+            await asyncio.sleep(0.2)
+        for runner in runners:
+            await runner.cleanup()
+
+    asyncio.run(_run())
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    if not samples:
+        return float("nan")
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _light_switches(counter: StateWriteCounter) -> list[str]:
+    return [
+        reg_entry.entity_id
+        for reg_entry in counter.registry_entries("switch")
+        if reg_entry.unique_id.endswith("_light")
+    ]
+
+
+def _wrap_refresh(coordinator: Any, latencies: list[float]) -> None:
+    original = coordinator._async_update_data
+
+    async def _timed() -> Any:
+        start = time.perf_counter()
+        try:
+            return await original()
+        finally:
+            latencies.append(time.perf_counter() - start)
+
+    coordinator._async_update_data = _timed
+
+
+async def _run_case(
+    controllers: int, args: argparse.Namespace, config: SimulatorConfig
+) -> dict[str, Any]:
+    from homeassistant.setup import async_setup_component
+    from homeassistant import loader
+    from pytest_homeassistant_custom_component.common import (
+        MockConfigEntry,
+        async_test_home_assistant,
+    )
+
+    from custom_components.waterco.const import DOMAIN
+
+    ports: Any = multiprocessing.Queue()
+    stop: Any = multiprocessing.Event()
+    process = multiprocessing.Process(
+        target=_serve_simulators, args=(controllers, config, ports, stop), daemon=True
+    )
+    process.start()
+    port_list = [ports.get(timeout=30) for _ in range(controllers)]
+
+    latencies: list[float] = []
+    confirmations: list[float] = []
+
+    with tempfile.TemporaryDirectory() as storage_dir:
+        async with async_test_home_assistant(storage_dir=storage_dir) as hass:
+            hass.data.pop(loader.DATA_CUSTOM_COMPONENTS, None)
+
+            counter = StateWriteCounter(hass)
+            entries = []
+            for port in port_list:
+                entry = MockConfigEntry(
+                    domain=DOMAIN,
+                    data={"ip_address": "127.0.0.1", "port": port},
+                    options={"scan_interval": args.scan_interval},
+                )
+                entry.add_to_hass(hass)
+                entries.append(entry)
+                counter.entry_ids.add(entry.entry_id)
+            await async_setup_component(hass, DOMAIN, {})
+            await hass.async_block_till_done()
+
+            for entry in entries:
+                _wrap_refresh(hass.data[DOMAIN][entry.entry_id], latencies)
+
+            counter.start()
+            cpu_start = time.thread_time()
+            wall_start = time.perf_counter()
+            deadline = wall_start + args.duration
+            next_command = wall_start + args.command_every
+            while (now := time.perf_counter()) < deadline:
+                if (
+                    args.command_every
+                    and now >= next_command
+                    and (light_switches := _light_switches(counter))
+                ):
+                    start = time.perf_counter()
+                    await hass.services.async_call(
+                        "switch", "toggle", {"entity_id": random.choice(light_switches)}, blocking=True
+                    )
+                    confirmations.append(time.perf_counter() - start)
+                    next_command = time.perf_counter() + args.command_every
+                await asyncio.sleep(0.1)
+            cpu = time.thread_time() - cpu_start
+            wall = time.perf_counter() - wall_start
+            counter.stop()
+
+            for entry in entries:
+                await hass.config_entries.async_unload(entry.entry_id)
+            await hass.async_block_till_done()
+            await hass.async_stop(force=True)
+
+    stop.set()
+    process.join(timeout=10)
+
+    return {
+        "controllers": controllers,
+        "refreshes": len(latencies),
+        "p50_ms": _percentile(latencies, 50) * 1000,
+        "p90_ms": _percentile(latencies, 90) * 1000,
+        "p99_ms": _percentile(latencies, 99) * 1000,
+        "cpu_ms_per_refresh": cpu / len(latencies) * 1000 if latencies else float("nan"),
+        "writes_per_min": counter.writes / wall * 60,
+        "confirm_ms": statistics.median(confirmations) * 1000 if confirmations else float("nan"),
+    }
+
+
+def _print_results(results: list[dict[str, Any]]) -> None:
+    header = (
+        f"{'ctrl':>5} {'refresh':>8} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} "
+        f"{'cpu ms':>8} {'writes/min':>11} {'confirm ms':>11}"
+    )
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        print(
+            f"{r['controllers']:>5} {r['refreshes']:>8} {r['p50_ms']:>8.1f} {r['p90_ms']:>8.1f} "
+            f"{r['p99_ms']:>8.1f} {r['cpu_ms_per_refresh']:>8.2f} {r['writes_per_min']:>11.1f} "
+            f"{r['confirm_ms']:>11.1f}"
+        )
+
+
+async def _main(args: argparse.Namespace) -> None:
+    config = config_from_args(args)
+    results = [await _run_case(count, args, config) for count in args.controllers]
+    _print_results(results)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--controllers", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--duration", type=float, default=60, help="seconds per case")
+    parser.add_argument("--scan-interval", type=int, default=5, help="scan interval (s)")
+    parser.add_argument(
+        "--command-every", type=float, default=10, help="seconds between light toggles, 0 to disable"
+    )
+    add_config_arguments(parser)
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
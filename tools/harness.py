@@ -0,0 +1,49 @@
+"""Helpers shared by the tools that run the integration in a test Home Assistant."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+
+class StateWriteCounter:
+    """Count state writes made by the entities of some config entries.
+
+    Entities are added once their keys show up in a payload, so each state
+    change is checked against the entity registry when it happens rather
+    than against a list taken after setup.
+    """
+
+    def __init__(self, hass: Any, entry_ids: Iterable[str] = ()) -> None:
+        from homeassistant.helpers import entity_registry as er
+
+        self.writes = 0
+        self.entry_ids = set(entry_ids)
+        self._registry = er.async_get(hass)
+        self._hass = hass
+        self._unsub: Any = None
+
+    def start(self) -> None:
+        from homeassistant.const import EVENT_STATE_CHANGED
+
+        self._unsub = self._hass.bus.async_listen(EVENT_STATE_CHANGED, self._count)
+
+    def stop(self) -> None:
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+
+    def _count(self, event: Any) -> None:
+        reg_entry = self._registry.async_get(event.data["entity_id"])
+        if reg_entry is not None and reg_entry.config_entry_id in self.entry_ids:
+            self.writes += 1
+
+    def registry_entries(self, domain: str) -> list[Any]:
+        """Return the registry entries of one domain currently added for the entries."""
+        from homeassistant.helpers import entity_registry as er
+
+        return [
+            reg_entry
+            for entry_id in self.entry_ids
+            for reg_entry in er.async_entries_for_config_entry(self._registry, entry_id)
+            if reg_entry.domain == domain
+        ]
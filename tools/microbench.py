@@ -0,0 +1,325 @@
+"""CPU microbenchmarks for payload indexing and entity state evaluation.
+
+Times the pure-CPU hot paths of a refresh without any I/O: building the
+snapshot index from payloads of growing nesting depth and key count,
+snapshot lookups (hits and misses), extract_state, icon lookups,
+make_device_info, each entity's state evaluation and a whole refresh
+(index plus every entity). Results are compared with the stored baseline
+and the run fails if any benchmark got measurably slower.
+
+Timings are divided by a fixed pure-Python calibration workload timed
+alongside them, so a baseline recorded on one machine is roughly usable
+on another. Microsecond timings are still noisy on busy or shared hosts:
+each benchmark is warmed up before it is timed, the baseline stores the
+median of several rounds together with a tolerance derived from their
+spread, and a benchmark only fails if it is slower on every retry.
+
+--save only records benchmarks that have no baseline yet. Re-record the
+existing ones with --replace, and only in a change meant to move them.
+
+    python tools/microbench.py                  # compare with the baseline
+    python tools/microbench.py --save           # record new benchmarks
+    python tools/microbench.py --save --replace # re-record every baseline
+    python tools/microbench.py --filter refresh # run matching benchmarks only
+"""
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import sys
+import timeit
+from collections.abc import Callable
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from simulator import DEFAULT_PAYLOAD  # noqa: E402
+
+from custom_components.waterco.binary_sensor import (  # noqa: E402
+    BINARY_SENSOR_DESCRIPTIONS,
+    GenericPoolBinarySensor,
+)
+from custom_components.waterco.device_icons import icon_table  # noqa: E402
+from custom_components.waterco.device_info import make_device_info  # noqa: E402
+from custom_components.waterco.number import NUMBER_DESCRIPTIONS, PoolNumber  # noqa: E402
+from custom_components.waterco.select import SELECT_DESCRIPTIONS, PoolSelect  # noqa: E402
+from custom_components.waterco.sensor import (  # noqa: E402
+    SENSOR_DESCRIPTIONS,
+    GenericPoolSensor,
+)
+from custom_components.waterco.snapshot import ElectrochlorSnapshot  # noqa: E402
+from custom_components.waterco.switch import (  # noqa: E402
+    SWITCH_DESCRIPTIONS,
+    GenericPoolSwitch,
+    extract_state,
+)
+
+BASELINE = Path(__file__).with_name("microbench_baseline.json")
+# Allowed slowdown for a benchmark, as a fraction of its baseline: this
+# many times the spread seen when saving, within the bounds below.
+SPREAD_FACTOR = 2
+MIN_TOLERANCE = 0.3
+# Even a noisy benchmark fails when it takes twice as long.
+MAX_TOLERANCE = 1.0
+# Timing runs per measurement; the fastest is kept. The first WARMUP runs
+# only fill caches and are thrown away.
+REPEAT = 7
+WARMUP = 2
+TARGET_SECONDS = 0.05
+# Measurements per benchmark when saving; the median is stored.
+SAVE_ROUNDS = 5
+# Extra measurements of a benchmark that looks slower before it fails.
+RETRIES = 3
+
+# (nesting depth, filler keys per level) for the synthetic payloads.
+PAYLOAD_SHAPES = ((1, 10), (4, 10), (16, 10), (1, 100), (4, 100), (16, 100))
+# Keys a smaller controller model leaves out of its payload.
+SMALL_MODEL_MISSING = ("aux2", "phPump", "valve", "pumpSpeed", "lightColor")
+
+
+def synthetic_payload(depth: int, keys: int) -> dict[str, Any]:
+    """Return the simulator payload with nested filler under result.
+
+    Each level holds keys scalars plus one dict for the next level, so the
+    index has to walk depth * keys extra entries that no entity reads.
+    """
+    payload = copy.deepcopy(DEFAULT_PAYLOAD)
+    level = payload["result"]
+    for depth_index in range(depth):
+        child: dict[str, Any] = {f"d{depth_index}k{key}": key * 0.5 for key in range(keys)}
+        level[f"extension{depth_index}"] = child
+        level = child
+    return payload
+
+
+def small_model_payload() -> dict[str, Any]:
+    payload = copy.deepcopy(DEFAULT_PAYLOAD)
+    for key in SMALL_MODEL_MISSING:
+        payload["result"].pop(key, None)
+        payload["result"]["status"].pop(key, None)
+    return payload
+
+
+class _BenchCoordinator:
+    """Just enough of the coordinator for entities to evaluate their state."""
+
+    def __init__(self, snapshot: ElectrochlorSnapshot) -> None:
+        self.hass = None
+        self.data = snapshot
+        self.available = True
+        self.is_stale = False
+        self.last_update_success = True
+
+
+def _entities(coordinator: _BenchCoordinator) -> list[Any]:
+    entry = SimpleNamespace(entry_id="microbench", data={"ip_address": "192.0.2.1"})
+    return [
+        *(GenericPoolSensor(coordinator, entry, d) for d in SENSOR_DESCRIPTIONS),
+        *(GenericPoolBinarySensor(coordinator, entry, d) for d in BINARY_SENSOR_DESCRIPTIONS),
+        *(GenericPoolSwitch(coordinator, entry, d) for d in SWITCH_DESCRIPTIONS),
+        *(PoolNumber(coordinator, entry, d) for d in NUMBER_DESCRIPTIONS),
+        *(PoolSelect(coordinator, entry, d) for d in SELECT_DESCRIPTIONS),
+    ]
+
+
+def _evaluate(entity: Any) -> tuple[Any, ...]:
+    """What a coordinator update costs one entity before the state write."""
+    entity._update_from_snapshot()
+    return entity._publish_signature()
+
+
+def _entity_name(entity: Any) -> str:
+    return f"{type(entity).__name__}.{entity.entity_description.key}"
+
+
+def benchmarks() -> dict[str, Callable[[], Any]]:
+    """Return every benchmark by name."""
+    cases: dict[str, Callable[[], Any]] = {}
+    base = ElectrochlorSnapshot.from_payload(copy.deepcopy(DEFAULT_PAYLOAD))
+
+    for depth, keys in PAYLOAD_SHAPES:
+        payload = synthetic_payload(depth, keys)
+        cases[f"index/depth{depth}-keys{keys}"] = (
+            lambda payload=payload: ElectrochlorSnapshot.from_payload(payload)
+        )
+
+    deep = ElectrochlorSnapshot.from_payload(synthetic_payload(16, 100))
+    cases["get/hit"] = lambda: deep.get("ph")
+    cases["get/nested-hit"] = lambda: deep.get("d15k99")
+    cases["get/miss"] = lambda: deep.get("missing")
+
+    values = (True, False, "on", "OFF", "1", 1, 0, 2.5, None, "unknown")
+    cases["extract_state"] = lambda: [extract_state(value) for value in values]
+
+    sensor_icons = icon_table("saltStatus")
+    switch_icons = icon_table("pump")
+    cases["icon/for_value"] = lambda: [sensor_icons.for_value(value) for value in values]
+    cases["icon/for_state"] = lambda: (switch_icons.for_state(True), switch_icons.for_state(False))
+
+    entry = SimpleNamespace(entry_id="microbench", data={"ip_address": "192.0.2.1"})
+    cases["device_info"] = lambda: make_device_info(entry, base)
+
+    coordinator = _BenchCoordinator(base)
+    for entity in _entities(coordinator):
+        cases[f"entity/{_entity_name(entity)}"] = lambda entity=entity: _evaluate(entity)
+
+    # Entities whose key the small model does not report: the miss path.
+    small_coordinator = _BenchCoordinator(ElectrochlorSnapshot.from_payload(small_model_payload()))
+    for entity in _entities(small_coordinator):
+        if entity.entity_description.key in SMALL_MODEL_MISSING:
+            cases[f"entity-missing/{_entity_name(entity)}"] = (
+                lambda entity=entity: _evaluate(entity)
+            )
+
+    for name, payload in (
+        *(
+            (f"depth{depth}-keys{keys}", synthetic_payload(depth, keys))
+            for depth, keys in PAYLOAD_SHAPES
+        ),
+        ("small-model", small_model_payload()),
+    ):
+        refresh_coordinator = _BenchCoordinator(base)
+        entities = _entities(refresh_coordinator)
+
+        def _refresh(
+            payload: dict[str, Any] = payload,
+            coordinator: _BenchCoordinator = refresh_coordinator,
+            entities: list[Any] = entities,
+        ) -> None:
+            coordinator.data = ElectrochlorSnapshot.from_payload(payload)
+            for entity in entities:
+                _evaluate(entity)
+
+        cases[f"refresh/{name}"] = _refresh
+    return cases
+
+
+def _calibration() -> int:
+    """Fixed dict-and-loop workload resembling the code under test."""
+    data = {str(key): key for key in range(200)}
+    total = 0
+    for key, value in data.items():
+        if isinstance(value, int) and key:
+            total += value
+    return total
+
+
+def _loops(timer: timeit.Timer) -> int:
+    number = 1
+    while timer.timeit(number) < TARGET_SECONDS / REPEAT:
+        number *= 2
+    return number
+
+
+def measure(func: Callable[[], Any]) -> tuple[float, float]:
+    """Return (seconds per call, time relative to the calibration workload).
+
+    The calibration is timed right before the benchmark in every repeat,
+    so CPU frequency changes and noisy neighbours affect both alike. The
+    fastest time of each is kept after the warm-up runs, and their ratio
+    is the relative time.
+    """
+    timer = timeit.Timer(func)
+    calibration = timeit.Timer(_calibration)
+    number = _loops(timer)
+    calibration_number = _loops(calibration)
+    seconds = reference = float("inf")
+    for run in range(WARMUP + REPEAT):
+        calibration_time = calibration.timeit(calibration_number) / calibration_number
+        bench_time = timer.timeit(number) / number
+        if run >= WARMUP:
+            reference = min(reference, calibration_time)
+            seconds = min(seconds, bench_time)
+    return seconds, seconds / reference
+
+
+def record(func: Callable[[], Any]) -> tuple[float, dict[str, float]]:
+    """Measure a benchmark SAVE_ROUNDS times for its baseline entry.
+
+    Returns the median seconds per call and the entry: the median relative
+    time and a tolerance that grows with the spread between rounds, so a
+    benchmark that is noisy on this machine does not fail every run.
+    """
+    rounds = sorted((measure(func) for _ in range(SAVE_ROUNDS)), key=lambda item: item[1])
+    seconds, relative = rounds[len(rounds) // 2]
+    spread = (rounds[-1][1] - rounds[0][1]) / relative
+    tolerance = min(MAX_TOLERANCE, max(MIN_TOLERANCE, SPREAD_FACTOR * spread))
+    return seconds, {"relative": float(f"{relative:.4g}"), "tolerance": round(tolerance, 2)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--save", action="store_true", help="record baselines for benchmarks that have none"
+    )
+    parser.add_argument(
+        "--replace", action="store_true", help="with --save, re-record existing baselines too"
+    )
+    parser.add_argument("--filter", help="only run benchmarks whose name contains this")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        help="allowed slowdown as a fraction, instead of each benchmark's own",
+    )
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    args = parser.parse_args()
+
+    baseline: dict[str, dict[str, float]] = (
+        json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    )
+    cases = {
+        name: func
+        for name, func in benchmarks().items()
+        if args.filter is None or args.filter in name
+    }
+
+    print(
+        f"{'benchmark':<48} {'us/call':>9} {'relative':>9} {'baseline':>9} "
+        f"{'change':>8} {'allowed':>8}"
+    )
+    recorded: dict[str, dict[str, float]] = {}
+    slower = []
+    for name, func in cases.items():
+        stored = baseline.get(name)
+        if args.save and (stored is None or args.replace):
+            seconds, recorded[name] = record(func)
+            value = recorded[name]["relative"]
+            old = f"{stored['relative']:>9.4f}" if stored else f"{'-':>9}"
+            print(f"{name:<48} {seconds * 1e6:>9.2f} {value:>9.4f} {old} {'saved':>8}")
+            continue
+        seconds, value = measure(func)
+        if stored is None:
+            print(f"{name:<48} {seconds * 1e6:>9.2f} {value:>9.4f} {'-':>9} {'new':>8}")
+            continue
+        reference = stored["relative"]
+        tolerance = stored["tolerance"] if args.tolerance is None else args.tolerance
+        change = value / reference - 1
+        # A slowdown has to show up on every retry to count.
+        for _ in range(RETRIES):
+            if change <= tolerance:
+                break
+            seconds, value = min((seconds, value), measure(func), key=lambda item: item[1])
+            change = value / reference - 1
+        flag = ""
+        if change > tolerance:
+            flag = "  SLOWER"
+            slower.append(name)
+        print(
+            f"{name:<48} {seconds * 1e6:>9.2f} {value:>9.4f} {reference:>9.4f} "
+            f"{change:>+7.0%} {tolerance:>+7.0%}{flag}"
+        )
+
+    if recorded:
+        baseline.update(recorded)
+        args.baseline.write_text(json.dumps(dict(sorted(baseline.items())), indent=2) + "\n")
+        print(f"\nSaved {len(recorded)} baselines to {args.baseline}")
+    if slower:
+        print(f"\n{len(slower)} benchmark(s) slower than their baseline allows")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
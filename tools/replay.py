@@ -0,0 +1,117 @@
+"""Replay a recorded controller traffic log through the integration.
+
+Feeds the status responses from a log written with the "record traffic"
+option back through the coordinator and all platforms of one config
+entry in a test Home Assistant instance, then reports how long that took
+and how many state writes it caused. Pass the live log; its rotated
+backups next to it are replayed first.
+
+Needs the Home Assistant test harness::
+
+    pip install pytest-homeassistant-custom-component
+    python tools/replay.py config/waterco/traffic-<entry_id>.jsonl.gz
+    python tools/replay.py --speed 60 config/waterco/traffic-<entry_id>.jsonl.gz
+
+Statistics and run-time counters use the wall clock, so their values are
+only meaningful when replaying at real speed (--speed 1).
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from harness import StateWriteCounter  # noqa: E402
+
+from custom_components.waterco.traffic import (  # noqa: E402
+    KIND_COMMAND,
+    ReplayTransport,
+    read_traffic,
+    traffic_files,
+)
+
+
+async def _replay(args: argparse.Namespace) -> dict[str, Any]:
+    from homeassistant import loader
+    from homeassistant.setup import async_setup_component
+    from pytest_homeassistant_custom_component.common import (
+        MockConfigEntry,
+        async_test_home_assistant,
+    )
+
+    from custom_components.waterco.const import DOMAIN
+
+    files = [file for log in args.logs for file in traffic_files(log)]
+    records = list(read_traffic(files))
+    kinds = Counter(record["k"] for record in records)
+    transport = ReplayTransport(records, speed=args.speed)
+
+    def _transport(hass: Any, host: str, port: int, breaker: Any, limiter: Any, metrics: Any) -> Any:
+        transport.metrics = metrics
+        return transport
+
+    with tempfile.TemporaryDirectory() as storage_dir:
+        async with async_test_home_assistant(storage_dir=storage_dir) as hass:
+            hass.data.pop(loader.DATA_CUSTOM_COMPONENTS, None)
+            # Keep scheduled polls and the rate limit out of the way: the
+            # replay loop below asks for every refresh itself.
+            entry = MockConfigEntry(
+                domain=DOMAIN,
+                data={"ip_address": "replay", "port": 0},
+                options={"scan_interval": 86400, "max_requests_per_minute": 10**6},
+            )
+            entry.add_to_hass(hass)
+            counter = StateWriteCounter(hass, [entry.entry_id])
+            counter.start()
+            cpu_start = time.thread_time()
+            wall_start = time.perf_counter()
+            with patch("custom_components.waterco.coordinator.ElectrochlorTransport", _transport):
+                await async_setup_component(hass, DOMAIN, {})
+                await hass.async_block_till_done()
+                coordinator = hass.data[DOMAIN][entry.entry_id]
+                while not transport.done:
+                    await coordinator.async_refresh()
+                await hass.async_block_till_done()
+            cpu = time.thread_time() - cpu_start
+            wall = time.perf_counter() - wall_start
+            counter.stop()
+
+            result = {
+                "files": len(files),
+                "records": len(records),
+                "status": kinds["status"],
+                "errors": kinds["error"],
+                "commands": kinds[KIND_COMMAND],
+                "wall_s": wall,
+                "cpu_ms_per_refresh": cpu / transport.position * 1000 if transport.position else 0.0,
+                "state_writes": counter.writes,
+                "suppressed_writes": coordinator.write_stats.suppressed,
+                "unchanged_refreshes": coordinator.write_stats.unchanged_refreshes,
+            }
+            await hass.config_entries.async_unload(entry.entry_id)
+            await hass.async_block_till_done()
+            await hass.async_stop(force=True)
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("logs", nargs="+", help="traffic log(s) to replay, oldest first")
+    parser.add_argument(
+        "--speed", type=float, default=0, help="1 for recorded timing, N for N times faster, 0 for no delay"
+    )
+    result = asyncio.run(_replay(parser.parse_args()))
+    for key, value in result.items():
+        print(f"{key:>20} {value:.3f}" if isinstance(value, float) else f"{key:>20} {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+"""Local simulator for Waterco Electrochlor pool controllers.
+
+Serves the status document on ``/electrochlor`` and accepts the multipart
+command POSTs the integration sends to ``/electrochlor/<path>``. Latency,
+jitter, dropped connections, malformed JSON and delayed state transitions
+are configurable so the integration can be exercised without hardware.
+
+Run standalone with::
+
+    python tools/simulator.py --count 3 --port 9000 --latency 0.2
+
+then add the integration against 127.0.0.1 on the printed port(s).
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import copy
+import json
+import random
+from dataclasses import dataclass
+from typing import Any
+
+from aiohttp import web
+
+API_PATH = "/electrochlor"
+
+# Command path -> status/result key it changes on the device.
+COMMAND_KEYS = {
+    "state": "pump",
+    "light": "light",
+    "phPump": "phPump",
+    "valve": "valve",
+    "aux2": "aux2",
+    # Assumed endpoints backing the pump speed number and light colour select.
+    "pumpSpeed": "pumpSpeed",
+    "lightColor": "lightColor",
+}
+STATUS_KEYS = {"pump", "light", "phPump", "valve", "aux2", "cellDirectionA", "cellDirectionB"}
+
+DEFAULT_PAYLOAD: dict[str, Any] = {
+    "result": {
+        "model": "Electrochlor EC-SIM",
+        "version": "sim-1.0",
+        "temp": 26.4,
+        "ph": 7.42,
+        "chlorineProduction": 60,
+        "operation": "Auto",
+        "operationType": "Timer",
+        "pumpSpeed": 2400,
+        "lightColor": "Blue",
+        "saltStatus": "NORMAL",
+        "status": {
+            "pump": True,
+            "light": False,
+            "phPump": False,
+            "valve": False,
+            "aux2": False,
+            "cellDirectionA": True,
+            "cellDirectionB": False,
+        },
+    },
+    "error": False,
+}
+
+
+@dataclass
+class SimulatorConfig:
+    """Behaviour knobs for one simulated controller."""
+
+    latency: float = 0.05
+    jitter: float = 0.02
+    drop_rate: float = 0.0
+    malformed_rate: float = 0.0
+    transition_delay: float = 1.0
+    # Random walk on temp/pH on every status read.
+    drift: bool = True
+
+
+def _parse_value(text: str) -> Any:
+    lowered = text.strip().lower()
+    if lowered in ("true", "false"):
+        return lowered == "true"
+    try:
+        return int(lowered)
+    except ValueError:
+        return text.strip()
+
+
+class ElectrochlorSimulator:
+    """One simulated controller."""
+
+    def __init__(self, config: SimulatorConfig | None = None, seed: int | None = None) -> None:
+        self.config = config or SimulatorConfig()
+        self.payload = copy.deepcopy(DEFAULT_PAYLOAD)
+        self.random = random.Random(seed)
+        self.status_requests = 0
+        self.command_requests = 0
+        self.app = web.Application()
+        self.app.router.add_get(API_PATH, self.handle_status)
+        self.app.router.add_post(f"{API_PATH}/{{path}}", self.handle_command)
+
+    async def _delay(self) -> None:
+        delay = self.config.latency + self.random.uniform(-self.config.jitter, self.config.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _drop(self, request: web.Request) -> bool:
+        if self.random.random() < self.config.drop_rate:
+            if request.transport is not None:
+                request.transport.abort()
+            return True
+        return False
+
+    def _drift(self) -> None:
+        result = self.payload["result"]
+        result["temp"] = round(result["temp"] + self.random.uniform(-0.05, 0.05), 2)
+        result["ph"] = round(result["ph"] + self.random.uniform(-0.005, 0.005), 3)
+
+    def set_value(self, key: str, value: Any) -> None:
+        """Apply a state change on the simulated device."""
+        result = self.payload["result"]
+        if key in STATUS_KEYS:
+            result["status"][key] = bool(value)
+        else:
+            result[key] = value
+
+    async def handle_status(self, request: web.Request) -> web.StreamResponse:
+        self.status_requests += 1
+        await self._delay()
+        if self._drop(request):
+            return web.Response()
+        if self.random.random() < self.config.malformed_rate:
+            return web.Response(text='{"result": {"temp": ', content_type="application/json")
+        if self.config.drift and self.payload["result"]["status"]["pump"]:
+            self._drift()
+        return web.Response(text=json.dumps(self.payload), content_type="application/json")
+
+    async def handle_command(self, request: web.Request) -> web.StreamResponse:
+        self.command_requests += 1
+        path = request.match_info["path"]
+        key = COMMAND_KEYS.get(path)
+        if key is None:
+            return web.Response(status=404, text=f"unknown command {path}")
+        form = await request.post()
+        if "value" not in form:
+            return web.Response(status=400, text="missing value")
+        value = _parse_value(str(form["value"]))
+        await self._delay()
+        if self._drop(request):
+            return web.Response()
+        asyncio.get_running_loop().call_later(
+            self.config.transition_delay, self.set_value, key, value
+        )
+        return web.Response(text="OK")
+
+
+async def async_start(
+    simulator: ElectrochlorSimulator, host: str = "127.0.0.1", port: int = 0
+) -> tuple[web.AppRunner, int]:
+    """Serve a simulator, returning its runner and bound port."""
+    runner = web.AppRunner(simulator.app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    sockets = site._server.sockets  # type: ignore[union-attr]
+    return runner, sockets[0].getsockname()[1]
+
+
+def add_config_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add SimulatorConfig options to an argument parser."""
+    parser.add_argument("--latency", type=float, default=0.05, help="base response delay (s)")
+    parser.add_argument("--jitter", type=float, default=0.02, help="+/- random delay (s)")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="fraction of dropped connections")
+    parser.add_argument("--malformed-rate", type=float, default=0.0, help="fraction of bad JSON replies")
+    parser.add_argument("--transition-delay", type=float, default=1.0, help="command to state change (s)")
+
+
+def config_from_args(args: argparse.Namespace) -> SimulatorConfig:
+    return SimulatorConfig(
+        latency=args.latency,
+        jitter=args.jitter,
+        drop_rate=args.drop_rate,
+        malformed_rate=args.malformed_rate,
+        transition_delay=args.transition_delay,
+    )
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    config = config_from_args(args)
+    runners = []
+    for index in range(args.count):
+        port = args.port + index if args.port else 0
+        runner, bound = await async_start(ElectrochlorSimulator(config), args.host, port)
+        runners.append(runner)
+        print(f"Electrochlor simulator {index + 1} on http://{args.host}:{bound}{API_PATH}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        for runner in runners:
+            await runner.cleanup()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9000, help="first port, 0 for random")
+    parser.add_argument("--count", type=int, default=1, help="number of controllers")
+    add_config_arguments(parser)
+    try:
+        asyncio.run(_serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()